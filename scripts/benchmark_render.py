@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Benchmark service document rendering throughput."""
+
+import click
+import os
+import tempfile
+import time
+from src.data_generator import iter_records
+from src.pdf_generator import ServiceDocumentPDFGenerator
+
+
+def render_uncached(pdf_gen, records, prefix, batch_size):
+	"""Render the way generate_pdf used to: parse the stylesheet and fonts per document."""
+	from weasyprint import HTML, CSS
+
+	for i, data in enumerate(records):
+		filepath = os.path.join(pdf_gen.output_dir, f"{prefix}_{i+1:04d}.pdf")
+		HTML(string=pdf_gen.engine._generate_html(data)).write_pdf(
+			filepath, stylesheets=[CSS(string=pdf_gen.engine.css)]
+		)
+
+
+def render_cached(pdf_gen, records, prefix, batch_size):
+	"""Render one document per call with the generator's reusable stylesheet and fonts."""
+	for i, data in enumerate(records):
+		pdf_gen.generate_pdf(data, f"{prefix}_{i+1:04d}.pdf")
+
+
+def render_batched(pdf_gen, records, prefix, batch_size):
+	"""Render ``batch_size`` documents per WeasyPrint layout pass."""
+	for start in range(0, len(records), batch_size):
+		batch = records[start:start + batch_size]
+		filenames = [f"{prefix}_{start+i+1:04d}.pdf" for i in range(len(batch))]
+		pdf_gen.generate_batch(batch, filenames)
+
+
+# Mode name -> (engine, render function)
+MODES = {
+	"uncached": ("markdown", render_uncached),
+	"cached": ("markdown", render_cached),
+	"html": ("html", render_cached),
+	"batch": ("html", render_batched),
+	"reportlab": ("reportlab", render_cached),
+}
+
+
+def check_engines(records):
+	"""
+	Check that every HTML engine builds the same document as the Markdown engine.
+
+	Returns:
+		list: (record index, engine) pairs whose HTML differs
+	"""
+	from src.weasyprint_engine import TEMPLATES
+
+	generators = {engine: ServiceDocumentPDFGenerator(engine=engine) for engine in TEMPLATES}
+	mismatches = []
+	for i, data in enumerate(records):
+		expected = generators["markdown"].engine._generate_html(data)
+		for engine, pdf_gen in generators.items():
+			if pdf_gen.engine._generate_html(data) != expected:
+				mismatches.append((i, engine))
+	return mismatches
+
+
+@click.command()
+@click.option("--count", "-n", default=50, help="Number of documents per mode")
+@click.option("--seed", "-s", default=42, type=int, help="Random seed for the records")
+@click.option(
+	"--mode",
+	"-m",
+	"modes",
+	multiple=True,
+	type=click.Choice(list(MODES.keys())),
+	help="Modes to benchmark (default: all)",
+)
+@click.option("--batch-size", "-b", default=10, help="Documents per layout pass in batch mode")
+@click.option(
+	"--check",
+	is_flag=True,
+	help="Only check that the HTML engines produce the same document as the Markdown engine",
+)
+def main(count, seed, modes, batch_size, check):
+	"""Measure docs/sec for each rendering mode on the same set of records."""
+	modes = modes or list(MODES.keys())
+	records = list(iter_records(count, seed=seed))
+
+	if check:
+		mismatches = check_engines(records)
+		for i, engine in mismatches:
+			click.echo(f"  Record {i}: '{engine}' engine differs from 'markdown'", err=True)
+		if mismatches:
+			raise SystemExit(1)
+		click.echo(f"All HTML engines match the Markdown engine on {count} records")
+		return
+
+	click.echo(f"Rendering {count} documents per mode...\n")
+	click.echo(f"  {'Mode':<12} {'Seconds':>9} {'Docs/sec':>10}")
+
+	results = {}
+	with tempfile.TemporaryDirectory() as output:
+		generators = {
+			engine: ServiceDocumentPDFGenerator(output_dir=output, engine=engine)
+			for engine in {MODES[mode][0] for mode in modes}
+		}
+
+		# Warm up imports and font lookups so the first mode is not penalized.
+		# Only the selected engines are loaded: ReportLab runs without WeasyPrint.
+		for engine, pdf_gen in generators.items():
+			render_cached(pdf_gen, records[:1], f"warmup_{engine}", batch_size)
+
+		for mode in modes:
+			engine, render = MODES[mode]
+			pdf_gen = generators[engine]
+			start = time.perf_counter()
+			render(pdf_gen, records, mode, batch_size)
+			elapsed = time.perf_counter() - start
+
+			results[mode] = count / elapsed
+			click.echo(f"  {mode:<12} {elapsed:>9.2f} {results[mode]:>10.1f}")
+
+	baseline = results.get("uncached")
+	if baseline:
+		click.echo("")
+		for mode, rate in results.items():
+			if mode != "uncached":
+				click.echo(f"  {mode}: {rate / baseline:.2f}x vs uncached")
+
+
+if __name__ == "__main__":
+	main()
@@ -5,8 +5,10 @@ import click
 import os
 import random
 from src.data_generator import ServiceDocumentDataGenerator
-from src.pdf_generator import ServiceDocumentPDFGenerator
-from src.constants import MACHINE_CATEGORIES, SERVICE_ISSUES
+from src.pdf_generator import ServiceDocumentPDFGenerator, ENGINES
+from src.constants import MACHINE_CATEGORIES
+from src.part_catalog import part_catalog
+from src.sku_index import part_sku, sku_index
 
 
 def find_part_by_sku(sku: str):
@@ -19,37 +21,91 @@ def find_part_by_sku(sku: str):
 	Returns:
 		Tuple of (category, issue, part_name) or None if not found
 	"""
-	sku_lower = sku.lower()
-	for category, issues in SERVICE_ISSUES.items():
-		for issue in issues:
-			for part in issue["parts"]:
-				if part.lower().startswith(sku_lower):
-					return (category, issue, part)
-	return None
+	matches = find_parts_by_sku(sku)
+	return matches[0] if matches else None
+
+
+def find_parts_by_sku(sku: str):
+	"""
+	Find every part matching a SKU.
+
+	Args:
+		sku: A complete SKU (e.g., "SKU-TC-001234"), or a SKU prefix (e.g., "SKU-TC")
+
+	Returns:
+		List of (category, issue, part_name) tuples, one per issue using a
+		matching part: the exact SKU's parts if there are any, otherwise
+		every part whose SKU starts with ``sku``
+	"""
+	index = sku_index()
+	return index.exact(sku) or index.prefix(sku)
+
+
+def select_parts(sku=None, family=None, keywords=()):
+	"""
+	Select parts by SKU, or by family code and keywords.
+
+	Args:
+		sku: A complete SKU or a SKU prefix
+		family: Family code (e.g., "TC"), the middle of a SKU
+		keywords: Words every selected part's name or specs must contain
+
+	Returns:
+		List of (part_name, usages) pairs, one per selected part, where usages
+		lists the (category, issue, part_name) tuples of the issues using it
+	"""
+	if sku:
+		parts = {}
+		for match in find_parts_by_sku(sku):
+			parts.setdefault(match[2], []).append(match)
+		return list(parts.items())
+
+	catalog = part_catalog()
+	selected = None
+	if family:
+		selected = catalog.family(family)
+	if keywords:
+		found = catalog.search(" ".join(keywords))
+		if selected is not None:
+			found = set(found)
+			found = [p for p in selected if p in found]
+		selected = found
+	return [(catalog.parts[p]["text"], catalog.usages(p)) for p in selected or []]
 
 
 def list_available_skus():
-	"""List all available SKUs in the system."""
-	skus = []
-	for category, issues in SERVICE_ISSUES.items():
-		for issue in issues:
-			for part in issue["parts"]:
-				if part.lower().startswith("sku-"):
-					sku = part.split(" - ")[0] if " - " in part else part[:15]
-					skus.append((sku, category, part))
-	return skus
+	"""List all available SKUs in the system, sorted by SKU."""
+	return sku_index().skus()
 
 
 @click.command()
 @click.argument("sku", required=False)
-@click.option("--count", "-n", default=5, help="Number of documents to generate")
+@click.option("--family", "-f", help="Select every part of a SKU family (e.g., TC)")
+@click.option(
+	"--keyword",
+	"-k",
+	"keywords",
+	multiple=True,
+	help="Select parts whose name or specs contain this word (repeatable)",
+)
+@click.option("--count", "-n", default=5, help="Number of documents to generate per part")
 @click.option("--output", "-o", default="output_sku", help="Output directory")
 @click.option("--list", "-l", "list_skus", is_flag=True, help="List available SKUs")
+@click.option(
+	"--engine",
+	"-e",
+	default="markdown",
+	type=click.Choice(ENGINES),
+	help="Render engine",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
-def main(sku, count, output, list_skus, verbose):
+def main(sku, family, keywords, count, output, list_skus, engine, verbose):
 	"""Generate service documents using a specific part SKU.
 
 	Example: generate_by_sku.py SKU-TC-001234 --count 10
+
+	Select several parts with a SKU prefix (SKU-TC), a family code
+	(--family TC) or keywords (--keyword thermocouple).
 	"""
 	# List mode
 	if list_skus:
@@ -66,49 +122,62 @@ def main(sku, count, output, list_skus, verbose):
 			click.echo(f"\n  ... and {len(skus) - 20} more")
 		return
 
-	# Generate mode - SKU required
-	if not sku:
+	# Generate mode - SKU, family or keywords required
+	if sku and (family or keywords):
+		raise click.UsageError("Give either a SKU or --family/--keyword, not both")
+	if not (sku or family or keywords):
 		click.echo("Error: SKU argument required. Use --list to see available SKUs.", err=True)
 		raise SystemExit(1)
 
-	result = find_part_by_sku(sku)
-	if not result:
-		click.echo(f"Error: SKU '{sku}' not found in SERVICE_ISSUES", err=True)
+	parts = select_parts(sku, family, keywords)
+	if not parts:
+		if sku:
+			click.echo(f"Error: SKU '{sku}' not found in the issue catalog", err=True)
+		else:
+			click.echo("Error: no parts match the given family and keywords", err=True)
 		click.echo("Use --list to see available SKUs", err=True)
 		raise SystemExit(1)
 
-	category, issue, part_name = result
-	models = MACHINE_CATEGORIES[category]["models"]
-
-	click.echo(f"Found part: {part_name}")
-	click.echo(f"Category: {category}")
-	click.echo(f"Available models: {', '.join(models)}")
-	click.echo(f"\nGenerating {count} documents...")
+	categories = sorted({category for _, usages in parts for category, _, _ in usages})
+	if len(parts) == 1:
+		click.echo(f"Found part: {parts[0][0]}")
+	else:
+		click.echo(f"Found {len(parts)} parts:")
+		for part_name, _ in parts[:10]:
+			click.echo(f"  {part_name}")
+		if len(parts) > 10:
+			click.echo(f"  ... and {len(parts) - 10} more")
+	click.echo(f"Used in {sum(len(usages) for _, usages in parts)} issue(s) in: {', '.join(categories)}")
+	total = count * len(parts)
+	click.echo(f"\nGenerating {total} documents...")
 
 	os.makedirs(output, exist_ok=True)
 	data_gen = ServiceDocumentDataGenerator()
-	pdf_gen = ServiceDocumentPDFGenerator(output_dir=output)
+	pdf_gen = ServiceDocumentPDFGenerator(output_dir=output, engine=engine)
 
-	for i in range(count):
-		# Generate base record but override with specific part/machine
-		data = data_gen.generate_service_record()
+	for i, data in enumerate(data_gen.iter_records(total)):
+		# Override the base record with the part and, in turn, the issues using it
+		part, j = divmod(i, count)
+		_, usages = parts[part]
+		category, issue, part_name = usages[j % len(usages)]
 		data["machine_type"] = category
-		data["machine_model"] = random.choice(models)
+		data["machine_model"] = random.choice(MACHINE_CATEGORIES[category]["models"])
 		data["problem_description"] = issue["problem"]
 		data["solution_applied"] = issue["solution"]
 		data["parts_used"] = part_name  # Always use this specific part
 
-		filename = f"sku_{sku.replace('-', '_')}_{i+1:04d}.pdf"
+		label = part_sku(part_name) or sku or "part"
+		filename = f"sku_{label.replace('-', '_')}_{i+1:04d}.pdf"
 		pdf_gen.generate_pdf(data, filename)
 
 		if verbose:
-			click.echo(f"  [{i+1}/{count}] {filename}")
+			click.echo(f"  [{i+1}/{total}] {filename}")
 			click.echo(f"    Machine: {data['machine_model']}")
 			click.echo(f"    Client: {data['client_name']}")
 		else:
 			click.echo(f"  Generated: {filename}")
 
-	click.echo(f"\nDone! {count} documents saved to '{output}/'")
+	click.echo(f"\nDone! {total} documents saved to '{output}/'")
 
 
 if __name__ == "__main__":
@@ -3,25 +3,254 @@
 
 import click
 import os
+from click.core import ParameterSource
 from pathlib import Path
 from src.data_generator import ServiceDocumentDataGenerator
-from src.pdf_generator import ServiceDocumentPDFGenerator
+from src.fleet import FleetSimulator
+from src.ids import digits_for
+from src.pdf_generator import ServiceDocumentPDFGenerator, ENGINES, create_engine
+from src.parallel import MemoryStats, RenderPool, current_rss
+from src.manifest import CorpusManifest
+from src.render_cache import record_fingerprint
+from src.sampling import AliasTable, parse_weight_spec
+from src.text_model import MarkovTextModel
+from src.text_variation import IssueVariator
+from src.value_pool import faker_for, parse_locale_mix
+
+
+# Seeded client value pools are reused between runs from here
+POOL_CACHE_DIR = ".pool_cache"
+
+# Record generator options that do not apply to --fleet
+FLEET_EXCLUSIVE = (
+	"pool_size",
+	"pool_reuse",
+	"skew",
+	"work_order_digits",
+	"locales",
+	"vary_text",
+	"typo_rate",
+	"text_model",
+)
+
+
+def build_generator(
+	count, seed, as_of, pool_size, pool_reuse, skew, work_order_digits,
+	locales, vary_text, typo_rate, text_model,
+):
+	"""Create the record generator from the command line options, reporting bad options."""
+	try:
+		locale_mix = parse_locale_mix(locales) if locales else None
+		for locale in locale_mix or ():
+			faker_for(locale)
+		# The generator draws from a mix of several locales with this table
+		if locale_mix and len(locale_mix) > 1:
+			AliasTable(list(locale_mix.values()))
+	except ValueError as e:
+		raise click.BadParameter(str(e), param_hint="--locales")
+
+	if vary_text and text_model:
+		raise click.UsageError("--vary-text and --text-model are alternative text sources")
+	text_source = None
+	if vary_text:
+		text_source = IssueVariator(seed, typo_rate)
+	elif text_model:
+		try:
+			text_source = MarkovTextModel.load(text_model, seed=seed)
+		except ValueError as e:
+			raise click.BadParameter(str(e), param_hint="--text-model")
+
+	# Every record gets its own work order, so the default width grows with
+	# --count (capped at 9 digits, the widest a RecordBatch stores)
+	if work_order_digits is None:
+		work_order_digits = min(digits_for(count, 6), 9)
+
+	try:
+		weights = {}
+		for item in skew:
+			dimension, _, spec = item.partition("=")
+			weights[dimension] = parse_weight_spec(spec)
+		data_gen = ServiceDocumentDataGenerator(
+			seed=seed,
+			as_of=as_of.date() if as_of else None,
+			pool_size=pool_size,
+			pool_reuse=pool_reuse,
+			pool_cache_dir=POOL_CACHE_DIR,
+			weights=weights,
+			work_order_digits=work_order_digits,
+			locales=locale_mix,
+			text_source=text_source,
+		)
+	except ValueError as e:
+		raise click.BadParameter(str(e), param_hint="--skew")
+
+	# Refuse up front rather than fail after rendering the documents that fit
+	capacity = min(data_gen.work_orders.capacity, data_gen.serials.capacity)
+	if count > capacity:
+		raise click.BadParameter(
+			f"{count} documents need more than the {capacity} unique work order and serial numbers",
+			param_hint=["--count", "--work-order-digits"],
+		)
+
+	return data_gen
 
 
 @click.command()
 @click.option("--count", "-n", default=10, help="Number of documents to generate")
 @click.option("--output", "-o", default="output", help="Output directory")
 @click.option("--seed", "-s", type=int, help="Random seed for reproducibility")
+@click.option(
+	"--workers",
+	"-w",
+	default=1,
+	type=click.IntRange(min=0),
+	help="Number of rendering processes (0 = one per CPU)",
+)
+@click.option(
+	"--engine",
+	"-e",
+	default="markdown",
+	type=click.Choice(ENGINES),
+	help="Render engine",
+)
+@click.option(
+	"--as-of",
+	type=click.DateTime(formats=["%Y-%m-%d"]),
+	help="Date service dates count back from (default: today), for runs that reproduce on any day",
+)
+@click.option(
+	"--cache-dir",
+	type=click.Path(file_okay=False),
+	help="Content-addressed render cache; unchanged documents are copied instead of re-rendered",
+)
+@click.option(
+	"--incremental",
+	"-i",
+	is_flag=True,
+	help="Only re-render documents whose record or template changed since the last run",
+)
+@click.option(
+	"--pool-size",
+	default=0,
+	type=click.IntRange(min=0),
+	help="Sample client names, addresses and phones from pools of this many precomputed values (0 = call Faker per record)",
+)
+@click.option(
+	"--pool-reuse",
+	default=1.0,
+	type=click.FloatRange(0, 1),
+	help="Fraction of records drawing client values from the pool",
+)
+@click.option(
+	"--skew",
+	multiple=True,
+	metavar="DIMENSION=SPEC",
+	help="Skew category, issue, technician, company or client sampling, "
+	"e.g. category=zipf:1.2 or category=Fryers:5,Refrigeration:4 (repeatable)",
+)
+@click.option(
+	"--work-order-digits",
+	type=click.IntRange(min=1, max=9),
+	help="Digits of the unique work order numbers (default: 6, or as many as --count needs; 6 digits allow 900,000 documents)",
+)
+@click.option(
+	"--locales",
+	metavar="LOCALE:WEIGHT,...",
+	help="Mix of Faker locales for client details, e.g. en_US:70,en_GB:20,de_DE:10 (default: en_US)",
+)
+@click.option(
+	"--vary-text",
+	is_flag=True,
+	help="Rephrase problem and solution texts so they rarely repeat (synonyms, reordering, typos)",
+)
+@click.option(
+	"--typo-rate",
+	default=0.01,
+	type=click.FloatRange(0, 1),
+	help="Share of words misspelled in varied problem texts",
+)
+@click.option(
+	"--text-model",
+	type=click.Path(exists=True, dir_okay=False),
+	help="Continue problem texts with a model trained by train_text_model.py",
+)
+@click.option(
+	"--max-docs-per-worker",
+	type=click.IntRange(min=1),
+	help="Restart each rendering process after this many documents",
+)
+@click.option(
+	"--max-worker-rss",
+	type=click.IntRange(min=1),
+	help="Restart the rendering processes once one of them uses more than this many MB",
+)
+@click.option(
+	"--fleet",
+	type=click.IntRange(min=1),
+	metavar="MACHINES",
+	help="Render the service history of a simulated fleet of this many machines, earliest visits first",
+)
+@click.option(
+	"--fleet-years",
+	default=2.0,
+	type=click.FloatRange(min=0, min_open=True),
+	help="Years of fleet history to simulate",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
-def generate(count, output, seed, verbose):
+def generate(
+	count,
+	output,
+	seed,
+	workers,
+	engine,
+	as_of,
+	cache_dir,
+	incremental,
+	pool_size,
+	pool_reuse,
+	skew,
+	work_order_digits,
+	locales,
+	vary_text,
+	typo_rate,
+	text_model,
+	max_docs_per_worker,
+	max_worker_rss,
+	fleet,
+	fleet_years,
+	verbose,
+):
 	"""Generate realistic service document PDFs for FoodTools."""
 
 	# Create output directory
 	os.makedirs(output, exist_ok=True)
 
-	# Initialize generators
-	data_gen = ServiceDocumentDataGenerator(seed=seed)
-	pdf_gen = ServiceDocumentPDFGenerator(output_dir=output)
+	# The fleet simulation draws its own records; these options only shape
+	# the record generator's
+	if fleet:
+		ctx = click.get_current_context()
+		ignored = [
+			f"--{name.replace('_', '-')}"
+			for name in FLEET_EXCLUSIVE
+			if ctx.get_parameter_source(name) is not ParameterSource.DEFAULT
+		]
+		if ignored:
+			raise click.UsageError(f"--fleet cannot be combined with {', '.join(ignored)}")
+
+		history = FleetSimulator(
+			fleet,
+			seed=seed,
+			as_of=as_of.date() if as_of else None,
+			years=fleet_years,
+			pool_cache_dir=POOL_CACHE_DIR,
+		).simulate()
+		count = min(count, len(history))
+		records = iter(history[:count])
+	else:
+		records = build_generator(
+			count, seed, as_of, pool_size, pool_reuse, skew, work_order_digits,
+			locales, vary_text, typo_rate, text_model,
+		).iter_records(count)
 
 	click.echo(f"Generating {count} service documents...")
 	click.echo(f"Output directory: {output}")
@@ -31,32 +260,111 @@ def generate(count, output, seed, verbose):
 
 	click.echo("")
 
-	# Generate documents
-	for i in range(count):
-		# Generate data
-		data = data_gen.generate_service_record()
+	# The manifest records what every document was rendered from, so a later
+	# --incremental run can keep the documents whose inputs did not change
+	template_hash = create_engine(engine).fingerprint()
+	manifest = CorpusManifest(engine, template_hash)
+	previous = CorpusManifest.load(output)
+
+	# Each record comes from its own (seed, index) stream, so a seed produces
+	# the same corpus regardless of the number of rendering processes
+	def build_tasks():
+		for i, data in enumerate(records):
+			filename = f"service_doc_{i+1:04d}.pdf"
+			manifest.add(filename, record_fingerprint(data))
+			yield data, filename
+
+	def unchanged(data, filename):
+		return incremental and previous is not None and previous.is_current(
+			output, filename, manifest.documents[filename], template_hash
+		)
+
+	# Restarting workers needs a pool, even when rendering in a single process
+	recycle = max_docs_per_worker is not None or max_worker_rss is not None
 
-		# Create filename
-		filename = f"service_doc_{i+1:04d}.pdf"
+	pool = None
+	if workers == 1 and not recycle:
+		pdf_gen = ServiceDocumentPDFGenerator(output_dir=output, engine=engine, cache_dir=cache_dir)
+		memory = MemoryStats()
+
+		def render_serial():
+			for data, filename in build_tasks():
+				if unchanged(data, filename):
+					yield data, os.path.join(output, filename), True
+				else:
+					filepath = pdf_gen.generate_pdf(data, filename)
+					memory.add(current_rss())
+					yield data, filepath, False
+
+		rendered = render_serial()
+	else:
+		pool = RenderPool(
+			output_dir=output,
+			engine=engine,
+			cache_dir=cache_dir,
+			workers=workers or None,
+			max_tasks_per_child=max_docs_per_worker,
+			max_rss=max_worker_rss * 1024 * 1024 if max_worker_rss else None,
+		)
+		memory = pool.memory
+		rendered = pool.render(build_tasks(), skip=unchanged)
+
+	# Generate documents
+	kept = 0
+	try:
+		# Count the decision made before rendering: once written, a
+		# regenerated document would look up to date
+		for i, (data, filepath, is_unchanged) in enumerate(rendered):
+			filename = os.path.basename(filepath)
+			kept += is_unchanged
 
-		# Generate PDF
-		filepath = pdf_gen.generate_pdf(data, filename)
+			if verbose:
+				status = "Unchanged" if is_unchanged else "Generated"
+				click.echo(f"  [{i+1}/{count}] {status}: {filename}")
+				click.echo(f"    - Client: {data['client_name']}")
+				click.echo(
+					f"    - Machine: {data['machine_model']} ({data['machine_type']})"
+				)
+				click.echo(f"    - Problem: {data['problem_description'][:50]}...")
+				click.echo("")
+	except ValueError as e:
+		# e.g. text the selected engine cannot draw
+		raise click.ClickException(str(e))
+	finally:
+		if pool is not None:
+			pool.close()
 
-		if verbose:
-			click.echo(f"  [{i+1}/{count}] Generated: {filename}")
-			click.echo(f"    - Client: {data['client_name']}")
-			click.echo(
-				f"    - Machine: {data['machine_model']} ({data['machine_type']})"
-			)
-			click.echo(f"    - Problem: {data['problem_description'][:50]}...")
-			click.echo("")
+	# Remove documents from the previous run that are no longer in the corpus.
+	# A full run leaves them alone but keeps them in the manifest, so a later
+	# --incremental run still finds and removes them.
+	removed = 0
+	if previous is not None and incremental:
+		for filename in previous.orphans(manifest):
+			path = os.path.join(output, filename)
+			if os.path.exists(path):
+				os.remove(path)
+				removed += 1
+	elif previous is not None:
+		manifest.carry_orphans(previous, output)
+	manifest.save(output)
 
 	# Calculate total size
 	total_size = sum(f.stat().st_size for f in Path(output).glob("*.pdf"))
 
 	click.echo("")
 	click.echo(f"Successfully generated {count} documents in '{output}/'")
+	if incremental:
+		click.echo(
+			f"Re-rendered {count - kept}, kept {kept} unchanged, removed {removed} orphaned"
+		)
 	click.echo(f"Total size: {total_size / 1024:.1f} KB")
+	if memory.samples:
+		click.echo(
+			f"Memory per rendering process: peak {memory.peak / 1024 / 1024:.1f} MB, "
+			f"steady state {memory.steady_state / 1024 / 1024:.1f} MB"
+		)
+	if pool is not None and pool.recycles:
+		click.echo(f"Restarted rendering processes {pool.recycles} times")
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ import re
 import click
 from anthropic import Anthropic
 from pydantic import BaseModel, Field
+from src.issue_store import catalog_revision, merge_issues
 
 # Pydantic models for structured output
 class ServiceIssue(BaseModel):
@@ -262,11 +263,13 @@ def validate_issues(issues: list[dict]) -> list[dict]:
 	help="Number of issues per API call (to ensure quality)",
 )
 @click.option(
+	"--merge",
 	"--merge-to-constants",
+	"merge",
 	is_flag=True,
-	help="After generation, output Python code to paste into constants.py",
+	help="After generation, add the new issues to the issue catalog (src/data/service_issues.json)",
 )
-def main(category, count, output, batch_size, merge_to_constants):
+def main(category, count, output, batch_size, merge):
 	"""Generate realistic service issue data using Claude AI."""
 	api_key = os.environ.get("ANTHROPIC_API_KEY")
 	if not api_key:
@@ -335,24 +338,12 @@ def main(category, count, output, batch_size, merge_to_constants):
 		json.dump(all_data, f, indent=2)
 	click.echo(f"\nSaved combined data to {combined_file}")
 
-	# Output Python code if requested
-	if merge_to_constants:
-		click.echo("\n" + "=" * 60)
-		click.echo("Python code to add to constants.py:")
-		click.echo("=" * 60 + "\n")
-		click.echo("SERVICE_ISSUES = {")
-		for cat, issues in all_data.items():
-			click.echo(f'\t"{cat}": [')
-			for issue in issues:
-				parts_str = json.dumps(issue["parts"])
-				click.echo(f"\t\t{{")
-				click.echo(f'\t\t\t"problem": {json.dumps(issue["problem"])},')
-				click.echo(f'\t\t\t"solution": {json.dumps(issue["solution"])},')
-				click.echo(f'\t\t\t"parts": {parts_str},')
-				click.echo(f"\t\t}},")
-			click.echo(f"\t],")
-		click.echo("}")
-
+	# Add the new issues to the catalog the generators read
+	if merge:
+		added = merge_issues(all_data)
+		for cat, n in added.items():
+			click.echo(f"Added {n} new issues for {cat} to the issue catalog")
+		click.echo(f"Issue catalog is now at revision {catalog_revision()}")
 
 if __name__ == "__main__":
 	main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Long-lived render server: service records in on stdin, results out on stdout."""
+
+import click
+import json
+import os
+import sys
+from datetime import date
+from src.data_generator import iter_records
+from src.pdf_generator import ServiceDocumentPDFGenerator, ENGINES
+
+
+def parse_record(record):
+	"""
+	Restore a service record decoded from JSON.
+
+	Args:
+		record (dict): Record with ``service_date`` as an ISO date string
+
+	Returns:
+		dict: The record with ``service_date`` as a date, as the renderers expect
+	"""
+	service_date = record.get("service_date")
+	if isinstance(service_date, str):
+		try:
+			record["service_date"] = date.fromisoformat(service_date)
+		except ValueError:
+			pass  # Rendered verbatim
+	return record
+
+
+def handle(request, pdf_gen, records, write, sequence):
+	"""
+	Render one request.
+
+	Args:
+		request (dict): ``record`` to render (generated if omitted), optional
+			``filename``, optional ``write`` overriding the server default and
+			optional ``id`` echoed back in the response
+		pdf_gen (ServiceDocumentPDFGenerator): Warm PDF generator
+		records (iterator): Generated records for requests without a record
+		write (bool): Write PDFs to the output directory by default
+		sequence (int): Request number, used for the default filename
+
+	Returns:
+		dict: Response with the PDF ``path`` or its length in ``bytes``, plus
+			the generated ``record`` when the request did not include one
+	"""
+	response = {"id": request["id"]} if "id" in request else {}
+	if "record" in request:
+		data = parse_record(request["record"])
+	else:
+		data = next(records)
+		response["record"] = dict(data)
+
+	if request.get("write", write):
+		filename = request.get("filename") or f"service_doc_{sequence:04d}.pdf"
+		response["path"] = pdf_gen.generate_pdf(data, filename)
+	else:
+		response["bytes"] = len(pdf_gen.render_pdf(data))
+	return response
+
+
+@click.command()
+@click.option("--output", "-o", default="output", help="Output directory")
+@click.option(
+	"--engine",
+	"-e",
+	default="markdown",
+	type=click.Choice(ENGINES),
+	help="Render engine",
+)
+@click.option("--cache-dir", type=click.Path(file_okay=False), help="Content-addressed render cache")
+@click.option("--seed", "-s", type=int, help="Random seed for records the server generates")
+@click.option(
+	"--no-write",
+	is_flag=True,
+	help="Render in memory and respond with the PDF size instead of a path",
+)
+def serve(output, engine, cache_dir, seed, no_write):
+	"""Render service documents requested as JSON lines on stdin.
+
+	Each input line is a JSON object such as
+	{"id": 1, "record": {...}, "filename": "doc.pdf"}. Each one gets a single
+	JSON line on stdout: {"id": 1, "path": "output/doc.pdf"}, {"id": 1,
+	"bytes": 48211} with --no-write, or {"id": 1, "error": "..."}. Without a
+	"record", the server generates one and includes it in the response.
+	"""
+	os.makedirs(output, exist_ok=True)
+
+	# Load everything up front so each request only pays for the render itself
+	pdf_gen = ServiceDocumentPDFGenerator(output_dir=output, engine=engine, cache_dir=cache_dir)
+	records = iter_records(seed=seed)
+
+	for sequence, line in enumerate(sys.stdin, start=1):
+		if not line.strip():
+			continue
+		request = None
+		try:
+			request = json.loads(line)
+			response = handle(request, pdf_gen, records, not no_write, sequence)
+		except Exception as e:
+			# One bad request must not take down the server
+			response = {"error": f"{type(e).__name__}: {e}"}
+			if isinstance(request, dict) and "id" in request:
+				response["id"] = request["id"]
+		sys.stdout.write(json.dumps(response, default=str) + "\n")
+		sys.stdout.flush()
+
+
+if __name__ == "__main__":
+	serve()
@@ -1,27 +1,242 @@
 """Generate realistic service document data using Faker."""
 
-from faker import Faker
+import itertools
+import numpy as np
 import random
-from datetime import datetime, timedelta
-from .constants import MACHINE_CATEGORIES, SERVICE_ISSUES, TECHNICIANS, COMPANIES
+from datetime import date, datetime, timedelta
+from .constants import MACHINE_CATEGORIES, TECHNICIANS, COMPANIES
+from .issue_store import service_issues
+from .sampling import DIMENSIONS, AliasTable, GroupedAliasTable, resolve_weights
+from .records import (
+	CLIENT_FIELDS,
+	MAX_PARTS,
+	TEXT_FIELDS,
+	RecordBatch,
+	ServiceRecord,
+	catalog_tables,
+)
+from .ids import IdAllocator
+from .value_pool import DEFAULT_LOCALE, ClientValuePool, faker_for
+
+
+# Records generated together by the vectorized path: block b holds records
+# b * VECTOR_BLOCK_SIZE up to (b + 1) * VECTOR_BLOCK_SIZE
+VECTOR_BLOCK_SIZE = 1024
+
+# First element of the stream key, keeping per-record and per-block streams apart
+_RECORD_STREAM = 0
+_BLOCK_STREAM = 1
+# Keys of the work order and serial number permutations
+_WORK_ORDER_STREAM = 2
+_SERIAL_STREAM = 3
+
+
+def _stream_seed(seed, *key):
+	"""
+	Derive an independent seed for the stream identified by ``key``.
+
+	Args:
+		seed (int): Generator seed
+		*key (int): Stream identifier, e.g. (_RECORD_STREAM, index)
+
+	Returns:
+		numpy.random.SeedSequence: Seed of the stream
+	"""
+	return np.random.SeedSequence(seed, spawn_key=key)
+
+
+def _python_seed(seed_sequence):
+	"""Turn a SeedSequence into an int seed for ``random.Random`` and Faker."""
+	return int.from_bytes(seed_sequence.generate_state(4).tobytes(), "little")
+
+
+def sample_parts(rng, issue):
+	"""
+	Draw the parts used for each of an array of issues.
+
+	70% of records use 1..min(3, available) distinct parts of their issue.
+	Sorting random keys, with padding slots pushed to the end, gives a random
+	subset in random order like random.sample.
+
+	Args:
+		rng (numpy.random.Generator): Random stream
+		issue (numpy.ndarray): Catalog issue code per record
+
+	Returns:
+		numpy.ndarray: MAX_PARTS part codes per record, padded with -1, as
+			stored in RecordBatch
+	"""
+	tables = catalog_tables()
+	n = len(issue)
+	part_counts = tables["part_counts"][issue]
+	has_parts = (rng.random(n) < 0.7) & (part_counts > 0)
+	num_parts = 1 + (rng.random(n) * np.minimum(MAX_PARTS, part_counts)).astype(np.int64)
+	slots = max(tables["max_parts"], MAX_PARTS)
+	keys = rng.random((n, slots))
+	keys[np.arange(slots) >= part_counts[:, None]] = 2.0
+	parts = np.argsort(keys, axis=1)[:, :MAX_PARTS]
+	used = (np.arange(MAX_PARTS) < num_parts[:, None]) & has_parts[:, None]
+	parts[~used] = -1
+	return parts
 
 
 class ServiceDocumentDataGenerator:
 	"""Generate realistic service document data for testing."""
 
-	def __init__(self, seed=None):
-		"""Initialize the generator with optional seed for reproducibility."""
-		self.fake = Faker()
-		if seed is not None:
-			Faker.seed(seed)
-			random.seed(seed)
+	def __init__(
+		self,
+		seed=None,
+		as_of=None,
+		pool_size=None,
+		pool_reuse=1.0,
+		pool_cache_dir=None,
+		vectorized=False,
+		weights=None,
+		work_order_digits=6,
+		serial_digits=8,
+		locales=None,
+		text_source=None,
+	):
+		"""
+		Initialize the generator with optional seed for reproducibility.
+
+		Record i is derived from its own random stream keyed by (seed, i), so
+		it does not depend on which records were generated before it, or in
+		which process.
+
+		Args:
+			seed (int, optional): Random seed. A random one is chosen if None.
+			as_of (date, optional): Service dates fall in the two years before
+				this date. Defaults to today; pass a fixed date to get the same
+				records from a seed on any day.
+			pool_size (int, optional): Enable pooled mode: client names,
+				addresses and phone numbers are sampled from pools of this many
+				precomputed values instead of calling Faker for every record
+			pool_reuse (float): Fraction of records taking their client values
+				from the pool; the rest still call Faker. Lower values give more
+				distinct clients at the cost of speed.
+			pool_cache_dir (str, optional): Directory caching seeded pools
+				between runs, keyed by seed, locale and size
+			vectorized (bool): Generate records with NumPy, VECTOR_BLOCK_SIZE
+				at a time, one random stream per block. Much faster in bulk,
+				but a different corpus than the per-record streams for the
+				same seed.
+			weights (dict, optional): Skew per dimension ("category",
+				"issue", "technician", "company", "client"), uniform when
+				absent. Each value is a spec for ``sampling.resolve_weights``:
+				``{"zipf": s}``, a weight list, or weights by name. "issue"
+				takes one spec for every category or a dict of specs by
+				category; "client" needs pooled mode and skews pool entries.
+			work_order_digits (int): Digits of work order numbers. Record i
+				gets the i-th ID of a seeded permutation of all numbers of this
+				width, so IDs never repeat, whichever process generates the
+				record; 6 digits allow 900,000 records. Size it for the corpus,
+				e.g. ``ids.digits_for(count, 6)``, since the width also decides
+				every record's ID.
+			serial_digits (int): Digits of serial numbers, allocated the same way
+			locales (dict, optional): Faker locale mix as locale -> weight,
+				e.g. ``{"en_US": 70, "en_GB": 20, "de_DE": 10}``; a list gives
+				an even mix. Each record's client details come from one locale.
+				Defaults to en_US only.
+			text_source (optional): Source of problem and solution texts,
+				such as ``text_variation.IssueVariator``. Its
+				``texts(issue, variant)`` is called with the catalog issue code
+				and the record index, and returns (problem, solution). Defaults
+				to the catalog texts.
+		"""
+		if locales is None:
+			locales = {DEFAULT_LOCALE: 1}
+		elif not isinstance(locales, dict):
+			locales = {locale: 1 for locale in locales}
+		self.locales = list(locales)
+		# Faker instances and pools are created once per locale and process
+		self.fakers = [faker_for(locale) for locale in self.locales]
+		self.fake = self.fakers[0]
+		self.locale_table = None
+		if len(self.locales) > 1:
+			self.locale_table = AliasTable(resolve_weights(locales, self.locales))
+		self.as_of = as_of or date.today()
+		self.categories = list(MACHINE_CATEGORIES)
+		self.issues = service_issues()
+		self.seed = seed if seed is not None else np.random.SeedSequence().entropy
+		self.vectorized = vectorized
+		# Index of the record generate_service_record returns next
+		self.next_index = 0
+		# Most recently generated vectorized block, as (block number, RecordBatch)
+		self._block = (None, None)
+		# Records of the most recently read block, as (block number, list)
+		self._block_records = (None, None)
+
+		self.pools = None
+		self.pool = None
+		self.pool_reuse = pool_reuse
+		if pool_size:
+			self.pools = [
+				ClientValuePool.load(pool_size, seed=seed, locale=locale, cache_dir=pool_cache_dir)
+				for locale in self.locales
+			]
+			self.pool = self.pools[0]
+
+		self.text_source = text_source
+		self.samplers = self._compile_weights(weights or {})
+		self.work_orders = IdAllocator(work_order_digits, self.seed, _WORK_ORDER_STREAM)
+		self.serials = IdAllocator(serial_digits, self.seed, _SERIAL_STREAM)
+
+	def _compile_weights(self, weights):
+		"""
+		Build alias tables for the skewed dimensions.
+
+		Returns:
+			dict: Dimension -> AliasTable (GroupedAliasTable for issues), only
+				for dimensions with a weight spec
+		"""
+		unknown = set(weights) - set(DIMENSIONS)
+		if unknown:
+			raise ValueError(f"Unknown weight dimensions: {', '.join(sorted(unknown))}")
+
+		samplers = {}
+		if "category" in weights:
+			samplers["category"] = AliasTable(resolve_weights(weights["category"], self.categories))
+		if "issue" in weights:
+			spec = weights["issue"]
+			# Issues have no names: a dict is either zipf or specs by category
+			per_category = (
+				isinstance(spec, dict)
+				and set(spec) <= set(self.categories)
+				and all(isinstance(value, (dict, list, tuple)) for value in spec.values())
+			)
+			if isinstance(spec, dict) and not per_category and set(spec) != {"zipf"}:
+				raise ValueError(
+					"issue= takes zipf:S (or a dict of specs by category in Python), not "
+					"weights by name; names work for category=, technician= and company=, "
+					"client= takes zipf:S or a list"
+				)
+			samplers["issue"] = GroupedAliasTable([
+				resolve_weights(
+					spec.get(category, {"zipf": 0}) if per_category else spec,
+					len(self.issues[category]),
+				)
+				for category in self.categories
+			])
+		if "technician" in weights:
+			names = [technician["name"] for technician in TECHNICIANS]
+			samplers["technician"] = AliasTable(resolve_weights(weights["technician"], names))
+		if "company" in weights:
+			samplers["company"] = AliasTable(resolve_weights(weights["company"], COMPANIES))
+		if "client" in weights:
+			if self.pool is None:
+				raise ValueError("Client weights need pooled mode (pool_size)")
+			samplers["client"] = AliasTable(resolve_weights(weights["client"], self.pool.size))
+		return samplers
 
 	def generate_service_record(self):
 		"""
 		Generate a complete service record with all required fields.
 
+		Returns the record at ``next_index`` and advances it.
+
 		Returns:
-			dict: Service record data matching the schema fields:
+			ServiceRecord: Service record data matching the schema fields:
 				- machine_model (str)
 				- machine_type (str)
 				- problem_description (str)
@@ -31,59 +246,380 @@ class ServiceDocumentDataGenerator:
 				- service_date (date)
 				Plus additional fields for the document layout.
 		"""
+		record = self.record_at(self.next_index)
+		self.next_index += 1
+		return record
+
+	def record_at(self, index):
+		"""
+		Generate the record at a given position of the corpus.
+
+		The result only depends on the seed, the options and ``index``, so
+		any record can be regenerated on its own and any split of a corpus
+		across shards or workers produces the same records.
+
+		Args:
+			index (int): Position of the record, starting at 0
+
+		Returns:
+			ServiceRecord: Service record data, as returned by ``generate_service_record``
+		"""
+		self._check_index(index)
+		if self.vectorized:
+			block, offset = divmod(index, VECTOR_BLOCK_SIZE)
+			if self._block_records[0] != block:
+				# Records are mostly read in order, so decode the block at once
+				self._block_records = (block, list(self._generate_block(block)))
+			return self._block_records[1][offset]
+
+		return self._record_at(index)
+
+	def _record_at(self, index, vary_text=True):
+		"""Generate record ``index`` from its own stream, optionally with catalog texts."""
+		stream = _python_seed(_stream_seed(self.seed, _RECORD_STREAM, index))
+		rnd = random.Random(stream)
+		locale = self.locale_table.draw(rnd) if self.locale_table else 0
+		self.fakers[locale].seed_instance(stream)
+		return self._build_record(rnd, index, locale, vary_text)
+
+	def _build_record(self, rnd, index, locale=0, vary_text=True):
+		"""
+		Build record ``index`` from the random stream ``rnd``.
+
+		The Faker instance of ``locale`` (an index into ``locales``) must be
+		seeded for the same record before calling this. With ``vary_text``
+		the texts come from the text source, if there is one.
+		"""
+		samplers = self.samplers
+		fake = self.fakers[locale]
+		pool = self.pools[locale] if self.pools else None
+
 		# Select machine category and details
-		category = random.choice(list(MACHINE_CATEGORIES.keys()))
+		if "category" in samplers:
+			category = self.categories[samplers["category"].draw(rnd)]
+		else:
+			category = rnd.choice(self.categories)
 		machine_data = MACHINE_CATEGORIES[category]
 
-		model = random.choice(machine_data["models"])
+		model = rnd.choice(machine_data["models"])
 
 		# Pick a linked problem-solution-parts entry for consistency
-		service_issue = random.choice(SERVICE_ISSUES[category])
+		if "issue" in samplers:
+			group = self.categories.index(category)
+			service_issue = self.issues[category][samplers["issue"].draw(rnd, group)]
+		else:
+			service_issue = rnd.choice(self.issues[category])
 		problem = service_issue["problem"]
 		solution = service_issue["solution"]
+		if vary_text and self.text_source is not None:
+			issue = catalog_tables()["issue_codes"][(category, problem, solution)]
+			problem, solution = self.text_source.texts(issue, index)
 
 		# 70% chance of parts being used - pick from this issue's valid parts
 		parts_used = None
-		if random.random() < 0.7:
+		if rnd.random() < 0.7:
 			available_parts = service_issue["parts"]
-			num_parts = random.randint(1, min(3, len(available_parts)))
-			parts_used = ", ".join(random.sample(available_parts, num_parts))
+			num_parts = rnd.randint(1, min(3, len(available_parts)))
+			parts_used = ", ".join(rnd.sample(available_parts, num_parts))
 
 		# Generate service metadata
-		service_date = self.fake.date_between(start_date="-2y", end_date="today")
-		technician = random.choice(TECHNICIANS)
-		company = random.choice(COMPANIES)
+		if pool is None:
+			service_date = fake.date_between(
+				start_date=self.as_of - timedelta(days=730), end_date=self.as_of
+			)
+		else:
+			# Same distribution as date_between, without its datetime arithmetic
+			service_date = self.as_of - timedelta(days=rnd.randint(0, 730))
+		if "technician" in samplers:
+			technician = TECHNICIANS[samplers["technician"].draw(rnd)]
+		else:
+			technician = rnd.choice(TECHNICIANS)
+		if "company" in samplers:
+			company = COMPANIES[samplers["company"].draw(rnd)]
+		else:
+			company = rnd.choice(COMPANIES)
 
 		# Generate client information
-		client_name = self.fake.company()
-		client_address = self.fake.address()
-		client_phone = self.fake.phone_number()
+		if pool is not None and rnd.random() < self.pool_reuse:
+			if "client" in samplers:
+				client = samplers["client"].draw(rnd)
+			else:
+				client = rnd.randrange(pool.size)
+			client_name = pool.get("client_name", client)
+			client_address = pool.get("client_address", client)
+			client_phone = pool.get("client_phone", client)
+		else:
+			client_name = fake.company()
+			client_address = fake.address()
+			client_phone = fake.phone_number()
 
 		# Generate additional details
-		serial_number = f"SN{self.fake.random_number(digits=8, fix_len=True)}"
-		work_order = f"WO-{self.fake.random_number(digits=6, fix_len=True)}"
+		serial_number = f"SN{self.serials.id_at(index)}"
+		work_order = f"WO-{self.work_orders.id_at(index)}"
 
 		# Service time details
-		arrival_time = self.fake.time(pattern="%H:%M")
-		duration = random.randint(30, 240)  # 30 min to 4 hours
+		# Anchored to as_of rather than the current time so a seed is reproducible
+		arrival_time = fake.time(
+			pattern="%H:%M", end_datetime=datetime.combine(self.as_of, datetime.min.time())
+		)
+		duration = rnd.randint(30, 240)  # 30 min to 4 hours
 
-		return {
+		return ServiceRecord(
 			# Required fields for extraction (match database schema)
-			"machine_model": model,
-			"machine_type": category,
-			"problem_description": problem,
-			"solution_applied": solution,
-			"parts_used": parts_used,
-			"client_name": client_name,
-			"service_date": service_date,
+			machine_model=model,
+			machine_type=category,
+			problem_description=problem,
+			solution_applied=solution,
+			parts_used=parts_used,
+			client_name=client_name,
+			service_date=service_date,
 			# Additional document details
-			"serial_number": serial_number,
-			"work_order": work_order,
-			"technician": technician,
-			"company": company,
-			"client_address": client_address,
-			"client_phone": client_phone,
-			"arrival_time": arrival_time,
-			"duration_minutes": duration,
-			"labor_hours": round(duration / 60, 2),
-		}
+			serial_number=serial_number,
+			work_order=work_order,
+			technician=technician,
+			company=company,
+			client_address=client_address,
+			client_phone=client_phone,
+			arrival_time=arrival_time,
+			duration_minutes=duration,
+			labor_hours=round(duration / 60, 2),
+		)
+
+	def generate_records(self, n):
+		"""
+		Generate the next ``n`` records.
+
+		Args:
+			n (int): Number of records
+
+		Returns:
+			list: ServiceRecords, as returned by ``generate_service_record``
+		"""
+		records = list(self.iter_records(n, start=self.next_index))
+		self.next_index += n
+		return records
+
+	def iter_records(self, count=None, start=0):
+		"""
+		Lazily generate records ``start``, ``start + 1``, ...
+
+		Only the record being yielded is held in memory (one block with
+		``vectorized=True``), so corpora of any size can be streamed.
+
+		Args:
+			count (int, optional): Number of records. Unbounded if None.
+			start (int): Index of the first record
+
+		Yields:
+			ServiceRecord: Service record data, as returned by ``record_at``
+		"""
+		indexes = itertools.count(start) if count is None else range(start, start + count)
+		for index in indexes:
+			yield self.record_at(index)
+
+	def iter_batches(self, batch_size, count=None, start=0, columnar=False):
+		"""
+		Lazily generate records in batches of ``batch_size``.
+
+		Args:
+			batch_size (int): Records per batch; the last batch may be shorter
+			count (int, optional): Number of records. Unbounded if None.
+			start (int): Index of the first record
+			columnar (bool): Yield RecordBatches instead of lists
+
+		Yields:
+			list or RecordBatch: Consecutive service records
+		"""
+		end = None if count is None else start + count
+		while end is None or start < end:
+			stop = start + batch_size if end is None else min(start + batch_size, end)
+			if columnar:
+				yield self.batch_at(start, stop)
+			else:
+				yield [self.record_at(index) for index in range(start, stop)]
+			start = stop
+
+	def batch_at(self, start, stop):
+		"""
+		Generate records ``start`` up to ``stop`` in columnar form.
+
+		With ``vectorized=True`` the records are sliced out of the generated
+		blocks without being built one by one.
+
+		Args:
+			start (int): Index of the first record
+			stop (int): Index after the last record
+
+		Returns:
+			RecordBatch: The records
+		"""
+		if stop > start:
+			self._check_index(stop - 1)
+		if not self.vectorized:
+			# Encoded with catalog texts, which identify the issues
+			batch = RecordBatch.from_records([self._record_at(i, False) for i in range(start, stop)])
+			if self.text_source is not None and stop > start:
+				batch.columns.update(self._texts(batch.columns["issue"], range(start, stop)))
+			return batch
+
+		slices = []
+		for block in range(start // VECTOR_BLOCK_SIZE, -(-stop // VECTOR_BLOCK_SIZE)):
+			first = block * VECTOR_BLOCK_SIZE
+			slices.append(self._generate_block(block)[max(start - first, 0) : stop - first])
+		return RecordBatch.concatenate(slices)
+
+	def _generate_block(self, block):
+		"""
+		Generate the records of one vectorized block from the block's own stream.
+
+		In pooled mode client values are sampled from the pool of each record's
+		locale; otherwise they come from the locale's Faker, one call per record.
+
+		Args:
+			block (int): Block number
+
+		Returns:
+			RecordBatch: The VECTOR_BLOCK_SIZE records of the block
+		"""
+		if self._block[0] == block:
+			return self._block[1]
+
+		stream = _stream_seed(self.seed, _BLOCK_STREAM, block)
+		for fake in self.fakers:
+			fake.seed_instance(_python_seed(stream))
+		rng = np.random.default_rng(stream)
+		n = VECTOR_BLOCK_SIZE
+		indexes = np.arange(block * n, (block + 1) * n)
+		tables = catalog_tables()
+
+		# Category, then uniform model and issue within the category, unless skewed
+		category = self._sample(rng, "category", len(tables["categories"]), n)
+		model = (rng.random(n) * tables["model_counts"][category]).astype(np.int64)
+		if "issue" in self.samplers:
+			issue = tables["issue_offsets"][category] + self.samplers["issue"].sample(rng, category)
+		else:
+			issue = tables["issue_offsets"][category] + (
+				rng.random(n) * tables["issue_counts"][category]
+			).astype(np.int64)
+
+		parts = sample_parts(rng, issue)
+		if self.text_source is not None:
+			columns = self._texts(issue, indexes.tolist())
+		else:
+			columns = {}
+
+		columns.update({
+			"category": category,
+			"model": model,
+			"issue": issue,
+			"parts": parts,
+			"service_date": self.as_of.toordinal() - rng.integers(0, 731, n),
+			"technician": self._sample(rng, "technician", len(TECHNICIANS), n),
+			"company": self._sample(rng, "company", len(COMPANIES), n),
+			"serial": self._block_ids(self.serials, indexes),
+			"work_order": self._block_ids(self.work_orders, indexes),
+			"arrival": rng.integers(0, 24 * 60, n),
+			"duration": rng.integers(30, 241, n),
+		})
+
+		if self.pool is not None:
+			pool_index = self._sample(rng, "client", self.pool.size, n).tolist()
+			pooled = (rng.random(n) < self.pool_reuse).tolist()
+		else:
+			pool_index = pooled = [False] * n
+		if self.locale_table is not None:
+			locale = self.locale_table.sample(rng, n).tolist()
+		else:
+			locale = [0] * n
+		clients = []
+		for use_pool, index, code in zip(pooled, pool_index, locale):
+			if use_pool:
+				pool = self.pools[code]
+				clients.append([pool.get(name, index) for name in CLIENT_FIELDS])
+			else:
+				fake = self.fakers[code]
+				clients.append([fake.company(), fake.address(), fake.phone_number()])
+		for name, values in zip(CLIENT_FIELDS, zip(*clients)):
+			columns[name] = values
+
+		batch = RecordBatch(columns)
+		self._block = (block, batch)
+		return batch
+
+	def _texts(self, issues, indexes):
+		"""
+		Get the text source's problem and solution texts of records.
+
+		Args:
+			issues (numpy.ndarray): Catalog issue code per record
+			indexes (list): Index per record
+
+		Returns:
+			dict: One list per TEXT_FIELDS entry
+		"""
+		texts = [
+			self.text_source.texts(issue, index) for issue, index in zip(issues.tolist(), indexes)
+		]
+		return dict(zip(TEXT_FIELDS, (list(column) for column in zip(*texts))))
+
+	@staticmethod
+	def _block_ids(allocator, indexes):
+		"""
+		Allocate IDs for a block, which may extend past the ID space.
+
+		Records past the end get 0; ``_check_index`` keeps them from being read.
+		"""
+		ids = np.zeros(len(indexes), dtype=np.int64)
+		valid = indexes < allocator.capacity
+		ids[valid] = allocator.ids_at(indexes[valid])
+		return ids
+
+	def _check_index(self, index):
+		"""Refuse record indexes past the work order or serial number space."""
+		capacity = min(self.work_orders.capacity, self.serials.capacity)
+		if index >= capacity:
+			raise ValueError(
+				f"Record {index} is past the {capacity} unique work order and serial "
+				"numbers; increase work_order_digits or serial_digits"
+			)
+
+	def _sample(self, rng, dimension, count, n):
+		"""Draw ``n`` option indexes of a dimension, skewed if it has weights."""
+		if dimension in self.samplers:
+			return self.samplers[dimension].sample(rng, n)
+		return rng.integers(0, count, n)
+
+
+def iter_records(count=None, seed=None, start=0, **options):
+	"""
+	Lazily generate service records from a new generator.
+
+	Args:
+		count (int, optional): Number of records. Unbounded if None.
+		seed (int, optional): Random seed
+		start (int): Index of the first record
+		**options: Further ServiceDocumentDataGenerator arguments
+
+	Yields:
+		ServiceRecord: Service record data
+	"""
+	yield from ServiceDocumentDataGenerator(seed=seed, **options).iter_records(count, start)
+
+
+def iter_batches(batch_size, count=None, seed=None, start=0, columnar=False, **options):
+	"""
+	Lazily generate lists of service records from a new generator.
+
+	Args:
+		batch_size (int): Records per batch; the last batch may be shorter
+		count (int, optional): Number of records. Unbounded if None.
+		seed (int, optional): Random seed
+		start (int): Index of the first record
+		columnar (bool): Yield RecordBatches instead of lists
+		**options: Further ServiceDocumentDataGenerator arguments
+
+	Yields:
+		list or RecordBatch: Consecutive service records
+	"""
+	generator = ServiceDocumentDataGenerator(seed=seed, **options)
+	yield from generator.iter_batches(batch_size, count, start, columnar)
@@ -0,0 +1,193 @@
+"""Simulate a fleet of machines and its time-ordered service history."""
+
+from datetime import date
+import numpy as np
+from .constants import TECHNICIANS, COMPANIES
+from .data_generator import sample_parts
+from .ids import IdAllocator, digits_for
+from .records import RecordBatch, catalog_tables
+from .sampling import AliasTable, GroupedAliasTable, zipf_weights
+from .value_pool import ClientValuePool
+
+
+# Average service visits per machine per year, by category
+DEFAULT_FAILURE_RATES = {
+	"Ovens": 2.0,
+	"Fryers": 3.0,
+	"Mixers": 1.0,
+	"Refrigeration": 2.5,
+	"Dishwashers": 2.0,
+	"Griddles": 1.5,
+}
+
+# Streams of the fleet's random draws, keyed under the seed
+_MACHINE_STREAM = 0
+_EVENT_STREAM = 1
+_WORK_ORDER_STREAM = 2
+_SERIAL_STREAM = 3
+
+
+class FleetSimulator:
+	"""
+	A fleet of machines owned by clients, and the service visits they need.
+
+	Each machine has a stable serial number, a client and a service company.
+	Visits arrive as a Poisson process at the machine's failure rate, which is
+	its category's rate scaled per model. Issues follow a per-model
+	distribution, so every model has its own typical faults. A share of each
+	machine's failures is one chronic issue, and any visit can be followed by
+	a repeat visit for the same issue a few days later. Everything is drawn
+	for the whole fleet at once with NumPy.
+	"""
+
+	def __init__(
+		self,
+		machines,
+		seed=None,
+		as_of=None,
+		years=2,
+		clients=None,
+		client_skew=1.0,
+		failure_rates=None,
+		model_rates=None,
+		issue_skew=1.0,
+		chronic_share=0.3,
+		repeat_rate=0.25,
+		repeat_gap_days=14,
+		pool_cache_dir=None,
+	):
+		"""
+		Initialize the fleet.
+
+		Args:
+			machines (int): Number of machines
+			seed (int, optional): Random seed. A random one is chosen if None.
+			as_of (date, optional): End of the simulated period. Defaults to today.
+			years (float): Length of the simulated period
+			clients (int, optional): Number of clients owning the machines.
+				Defaults to one per five machines.
+			client_skew (float): Zipf exponent of machines per client, so a
+				few big clients own most of the fleet; 0 spreads them evenly
+			failure_rates (dict, optional): Visits per machine per year by
+				category, overriding DEFAULT_FAILURE_RATES
+			model_rates (dict, optional): Visits per machine per year by model
+				name. Other models get their category's rate, scaled by a
+				seeded per-model factor.
+			issue_skew (float): Zipf exponent of each model's issue distribution
+			chronic_share (float): Share of a machine's failures that are its
+				chronic issue
+			repeat_rate (float): Probability that a visit is followed by a
+				repeat visit for the same issue
+			repeat_gap_days (float): Mean days between a visit and its repeat
+			pool_cache_dir (str, optional): Directory caching client value pools
+		"""
+		self.seed = seed if seed is not None else np.random.SeedSequence().entropy
+		self.as_of = as_of or date.today()
+		self.years = years
+		self.chronic_share = chronic_share
+		self.repeat_rate = repeat_rate
+		self.repeat_gap_days = repeat_gap_days
+		self.clients = ClientValuePool.load(
+			clients or max(1, machines // 5), seed=seed, cache_dir=pool_cache_dir
+		)
+
+		tables = catalog_tables()
+		rng = np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(_MACHINE_STREAM,)))
+		categories = tables["categories"]
+		rates = {**DEFAULT_FAILURE_RATES, **(failure_rates or {})}
+
+		# Models numbered across categories; model_category maps them back
+		model_category = np.repeat(np.arange(len(categories)), tables["model_counts"])
+		model_names = [model for models in tables["models"] for model in models]
+		model_rate = np.array([rates[categories[c]] for c in model_category])
+		model_rate *= rng.lognormal(0.0, 0.3, len(model_names))
+		for name, rate in (model_rates or {}).items():
+			if name not in model_names:
+				raise ValueError(f"Unknown model '{name}'")
+			model_rate[model_names.index(name)] = rate
+
+		# Each model's issues ranked in a seeded order, then Zipf-weighted
+		self._issue_tables = GroupedAliasTable([
+			zipf_weights(count, issue_skew)[rng.permutation(count)]
+			for count in tables["issue_counts"][model_category]
+		])
+
+		# Machines: model, owner and chronic issue. A client's machines are
+		# all serviced by the client's service company.
+		model = rng.integers(0, len(model_names), machines)
+		category = model_category[model]
+		client_table = AliasTable(zipf_weights(self.clients.size, client_skew))
+		self.machines = {
+			"category": category,
+			"model": model - np.concatenate(([0], np.cumsum(tables["model_counts"])[:-1]))[category],
+			"model_id": model,
+			"rate": model_rate[model],
+			"client": client_table.sample(rng, machines),
+			"chronic_issue": self._issue_tables.sample(rng, model),
+			"serial": IdAllocator(8, self.seed, _SERIAL_STREAM).ids_at(np.arange(machines)),
+		}
+		self.client_company = rng.integers(0, len(COMPANIES), self.clients.size)
+
+	def simulate(self):
+		"""
+		Simulate the service visits of the whole fleet.
+
+		The same seed and options always give the same history.
+
+		Returns:
+			RecordBatch: One record per visit, ordered by service date
+		"""
+		tables = catalog_tables()
+		machines = self.machines
+		rng = np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(_EVENT_STREAM,)))
+		span = int(self.years * 365)
+
+		# Primary failures: Poisson count per machine, uniform over the period
+		counts = rng.poisson(machines["rate"] * self.years)
+		machine = np.repeat(np.arange(len(counts)), counts)
+		day = rng.integers(0, span + 1, len(machine))
+		issue = np.where(
+			rng.random(len(machine)) < self.chronic_share,
+			machines["chronic_issue"][machine],
+			self._issue_tables.sample(rng, machines["model_id"][machine]),
+		)
+
+		# Repeat visits, one generation at a time, until none fall in the period
+		parents = (machine, day, issue)
+		events = [parents]
+		while len(parents[0]):
+			repeat = rng.random(len(parents[0])) < self.repeat_rate
+			gap = 1 + rng.exponential(self.repeat_gap_days, int(repeat.sum())).astype(np.int64)
+			child_day = parents[1][repeat] + gap
+			inside = child_day <= span
+			parents = (parents[0][repeat][inside], child_day[inside], parents[2][repeat][inside])
+			events.append(parents)
+		machine, day, issue = (np.concatenate(column) for column in zip(*events))
+
+		order = np.lexsort((machine, day))
+		machine, day, issue = machine[order], day[order], issue[order]
+		category = machines["category"][machine]
+		issue = tables["issue_offsets"][category] + issue
+		client = machines["client"][machine]
+		n = len(machine)
+
+		# Work orders wide enough for every visit, and never fewer than the usual 6 digits
+		work_orders = IdAllocator(digits_for(n, 6), self.seed, _WORK_ORDER_STREAM)
+
+		columns = {
+			"category": category,
+			"model": machines["model"][machine],
+			"issue": issue,
+			"parts": sample_parts(rng, issue),
+			"service_date": self.as_of.toordinal() - span + day,
+			"technician": rng.integers(0, len(TECHNICIANS), n),
+			"company": self.client_company[client],
+			"serial": machines["serial"][machine],
+			"work_order": work_orders.ids_at(np.arange(n)),
+			"arrival": rng.integers(0, 24 * 60, n),
+			"duration": rng.integers(30, 241, n),
+		}
+		for name in ("client_name", "client_address", "client_phone"):
+			values = self.clients.values[name]
+			columns[name] = [values[c] for c in client.tolist()]
+		return RecordBatch(columns)
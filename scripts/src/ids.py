@@ -0,0 +1,146 @@
+"""Collision-free IDs from a keyed permutation of the ID space."""
+
+import numpy as np
+
+
+_MASK64 = (1 << 64) - 1
+_FEISTEL_ROUNDS = 4
+
+
+def _mix(x, key):
+	"""Hash ``x`` with a round key (splitmix64 finalizer). Python int version."""
+	x = ((x ^ key) * 0x9E3779B97F4A7C15) & _MASK64
+	x ^= x >> 32
+	x = (x * 0xBF58476D1CE4E5B9) & _MASK64
+	return x ^ (x >> 29)
+
+
+def _mix_array(x, key):
+	"""Hash an array of uint64 with a round key, wrapping like ``_mix``."""
+	x = (x ^ np.uint64(key)) * np.uint64(0x9E3779B97F4A7C15)
+	x ^= x >> np.uint64(32)
+	x = x * np.uint64(0xBF58476D1CE4E5B9)
+	return x ^ (x >> np.uint64(29))
+
+
+def digits_for(count, minimum=1):
+	"""
+	Return the fewest ID digits that give ``count`` distinct IDs.
+
+	Args:
+		count (int): Number of IDs needed
+		minimum (int): Fewest digits to use
+
+	Returns:
+		int: Number of digits, at least ``minimum``
+	"""
+	digits = minimum
+	while 9 * 10 ** (digits - 1) < count:
+		digits += 1
+	return digits
+
+
+class KeyedPermutation:
+	"""
+	A seeded pseudo-random permutation of ``range(size)``.
+
+	A balanced Feistel network permutes the smallest power-of-four range
+	covering ``size``; values that land outside ``range(size)`` are fed
+	through it again (cycle walking) until they land inside, which takes
+	fewer than four rounds on average. Distinct inputs therefore always map
+	to distinct outputs, with O(1) time and memory and no shared state.
+	"""
+
+	def __init__(self, size, seed, stream=0):
+		"""
+		Initialize the permutation.
+
+		Args:
+			size (int): Size of the permuted range
+			seed (int): Key of the permutation
+			stream (int): Distinguishes permutations sharing a seed
+		"""
+		self.size = size
+		self._half_bits = max(1, (max(size - 1, 1).bit_length() + 1) // 2)
+		self._half_mask = (1 << self._half_bits) - 1
+		state = np.random.SeedSequence(seed, spawn_key=(stream,)).generate_state(
+			_FEISTEL_ROUNDS, dtype=np.uint64
+		)
+		self._keys = [int(key) for key in state]
+
+	def __call__(self, index):
+		"""
+		Permute one value.
+
+		Args:
+			index (int): Value in ``range(size)``
+
+		Returns:
+			int: Its image, also in ``range(size)``
+		"""
+		if not 0 <= index < self.size:
+			raise ValueError(f"Index {index} is outside the ID space of {self.size} IDs")
+		bits, mask = self._half_bits, self._half_mask
+		x = index
+		while True:
+			left, right = x >> bits, x & mask
+			for key in self._keys:
+				left, right = right, left ^ (_mix(right, key) & mask)
+			x = (left << bits) | right
+			if x < self.size:
+				return x
+
+	def map(self, indexes):
+		"""
+		Permute an array of values at once.
+
+		Args:
+			indexes (numpy.ndarray): Values in ``range(size)``
+
+		Returns:
+			numpy.ndarray: Their images, as int64
+		"""
+		indexes = np.asarray(indexes, dtype=np.uint64)
+		if len(indexes) and int(indexes.max()) >= self.size:
+			raise ValueError(f"Index {int(indexes.max())} is outside the ID space of {self.size} IDs")
+		bits, mask = np.uint64(self._half_bits), np.uint64(self._half_mask)
+		result = indexes.copy()
+		walking = np.ones(len(result), dtype=bool)
+		while walking.any():
+			x = result[walking]
+			left, right = x >> bits, x & mask
+			for key in self._keys:
+				left, right = right, left ^ (_mix_array(right, key) & mask)
+			x = (left << bits) | right
+			result[walking] = x
+			walking[walking] = x >= np.uint64(self.size)
+		return result.astype(np.int64)
+
+
+class IdAllocator:
+	"""Issue unique fixed-width numeric IDs, one per record index."""
+
+	def __init__(self, digits, seed, stream=0):
+		"""
+		Initialize the allocator.
+
+		Args:
+			digits (int): Number of digits of every ID, without leading zeros
+			seed (int): Generator seed; the same seed gives the same IDs
+			stream (int): Distinguishes allocators sharing a seed
+		"""
+		self.low = 10 ** (digits - 1)
+		self.permutation = KeyedPermutation(9 * self.low, seed, stream)
+
+	@property
+	def capacity(self):
+		"""Number of distinct IDs."""
+		return self.permutation.size
+
+	def id_at(self, index):
+		"""Return the ID of record ``index``; distinct indexes get distinct IDs."""
+		return self.low + self.permutation(index)
+
+	def ids_at(self, indexes):
+		"""Return the IDs of an array of record indexes."""
+		return self.low + self.permutation.map(indexes)
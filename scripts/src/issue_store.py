@@ -0,0 +1,151 @@
+"""The service issue catalog: a versioned JSON file loaded on first use."""
+
+import gc
+import json
+import marshal
+import os
+import tempfile
+from functools import lru_cache
+
+
+STORE_VERSION = 1
+
+# The catalog, by machine category, written by generate_service_data.py
+ISSUES_FILE = os.path.join(os.path.dirname(__file__), "data", "service_issues.json")
+
+
+def _snapshot_path(path):
+	"""Binary snapshot of ``path``, kept in __pycache__ like compiled modules."""
+	return os.path.join(os.path.dirname(path), "__pycache__", os.path.basename(path) + ".snapshot")
+
+
+def read_issue_file(path=ISSUES_FILE):
+	"""
+	Read an issue file, through its binary snapshot when it is current.
+
+	The snapshot is a marshal dump of the parsed file, which loads several
+	times faster than JSON. It records the size and modification time of the
+	file it was made from, and is rewritten whenever they change.
+
+	Args:
+		path (str): Issue file
+
+	Returns:
+		dict: ``{"version": ..., "revision": ..., "issues": {category: [issue, ...]}}``
+
+	Raises:
+		ValueError: If the file has an unsupported version
+	"""
+	stat = os.stat(path)
+	source = [STORE_VERSION, marshal.version, stat.st_size, stat.st_mtime_ns]
+	snapshot = _snapshot_path(path)
+	# Building a large catalog would otherwise trigger many garbage
+	# collections that find nothing to collect
+	collecting = gc.isenabled()
+	gc.disable()
+	try:
+		try:
+			with open(snapshot, "rb") as f:
+				header, data = marshal.loads(f.read())
+			if header == source:
+				return data
+		except (OSError, EOFError, ValueError, TypeError):
+			pass
+
+		with open(path, encoding="utf-8") as f:
+			data = json.load(f)
+	finally:
+		if collecting:
+			gc.enable()
+	if data.get("version") != STORE_VERSION:
+		raise ValueError(f"{path} has version {data.get('version')}, expected {STORE_VERSION}")
+
+	# The snapshot is only a speedup; a read-only checkout just parses JSON
+	try:
+		os.makedirs(os.path.dirname(snapshot), exist_ok=True)
+		fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(snapshot), suffix=".tmp")
+		with os.fdopen(fd, "wb") as f:
+			marshal.dump((source, data), f)
+		os.replace(tmp_path, snapshot)
+	except OSError:
+		pass
+	return data
+
+
+@lru_cache(maxsize=None)
+def _catalog(path):
+	return read_issue_file(path)
+
+
+def service_issues(path=ISSUES_FILE):
+	"""
+	Return the issue catalog, loading it on the first call.
+
+	Args:
+		path (str): Issue file
+
+	Returns:
+		dict: Machine category -> list of issues, each with a "problem", a
+			"solution" and a list of "parts"
+	"""
+	return _catalog(path)["issues"]
+
+
+def catalog_revision(path=ISSUES_FILE):
+	"""Revision of the catalog, incremented on every write; keys caches derived from it."""
+	return _catalog(path)["revision"]
+
+
+def write_issue_file(issues, path=ISSUES_FILE):
+	"""
+	Replace the catalog with ``issues``, as the next revision.
+
+	Args:
+		issues (dict): Machine category -> list of issues
+		path (str): Issue file
+
+	Returns:
+		int: The new revision
+	"""
+	try:
+		revision = read_issue_file(path)["revision"] + 1
+	except FileNotFoundError:
+		revision = 1
+	data = {"version": STORE_VERSION, "revision": revision, "issues": issues}
+
+	directory = os.path.dirname(path) or "."
+	os.makedirs(directory, exist_ok=True)
+	fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+	with os.fdopen(fd, "w", encoding="utf-8") as f:
+		json.dump(data, f, indent="\t", ensure_ascii=False)
+		f.write("\n")
+	os.replace(tmp_path, path)
+	_catalog.cache_clear()
+	return revision
+
+
+def merge_issues(new_issues, path=ISSUES_FILE):
+	"""
+	Add issues to the catalog, skipping problems it already has.
+
+	Args:
+		new_issues (dict): Machine category -> list of issues
+		path (str): Issue file
+
+	Returns:
+		dict: Machine category -> number of issues added
+	"""
+	issues = read_issue_file(path)["issues"] if os.path.exists(path) else {}
+	added = {}
+	for category, candidates in new_issues.items():
+		existing = issues.setdefault(category, [])
+		seen = {issue["problem"].lower().strip() for issue in existing}
+		added[category] = 0
+		for issue in candidates:
+			key = issue["problem"].lower().strip()
+			if key not in seen:
+				seen.add(key)
+				existing.append(issue)
+				added[category] += 1
+	write_issue_file(issues, path)
+	return added
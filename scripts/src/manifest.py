@@ -0,0 +1,103 @@
+"""Manifest of a generated corpus, used to regenerate only what changed."""
+
+import json
+import os
+import tempfile
+
+
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+class CorpusManifest:
+	"""Record hash of every document in an output directory, plus the template hash."""
+
+	def __init__(self, engine, template_hash, documents=None):
+		"""
+		Initialize the manifest.
+
+		Args:
+			engine (str): Render engine name
+			template_hash (str): Fingerprint of the engine's output
+			documents (dict, optional): Filename -> record hash
+		"""
+		self.engine = engine
+		self.template_hash = template_hash
+		self.documents = documents or {}
+
+	@classmethod
+	def load(cls, output_dir):
+		"""
+		Load the manifest of an output directory.
+
+		Returns:
+			CorpusManifest: The manifest, or None if there is no usable manifest
+		"""
+		path = os.path.join(output_dir, MANIFEST_FILENAME)
+		try:
+			with open(path) as f:
+				data = json.load(f)
+		except (OSError, ValueError):
+			return None
+		if data.get("version") != MANIFEST_VERSION:
+			return None
+		return cls(data["engine"], data["template_hash"], data["documents"])
+
+	def save(self, output_dir):
+		"""Write the manifest to the output directory, replacing it atomically."""
+		data = {
+			"version": MANIFEST_VERSION,
+			"engine": self.engine,
+			"template_hash": self.template_hash,
+			"documents": self.documents,
+		}
+		fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
+		with os.fdopen(fd, "w") as f:
+			json.dump(data, f, indent=1, sort_keys=True)
+		os.replace(tmp_path, os.path.join(output_dir, MANIFEST_FILENAME))
+
+	def add(self, filename, record_hash):
+		"""Record the document written to ``filename``."""
+		self.documents[filename] = record_hash
+
+	def is_current(self, output_dir, filename, record_hash, template_hash):
+		"""
+		Check whether a document is already up to date.
+
+		Returns:
+			bool: True if ``filename`` exists and was rendered from the same
+				record with the same template
+		"""
+		return (
+			self.template_hash == template_hash
+			and self.documents.get(filename) == record_hash
+			and os.path.exists(os.path.join(output_dir, filename))
+		)
+
+	def carry_orphans(self, previous, output_dir):
+		"""
+		Keep listing the documents of ``previous`` that this run left in place.
+
+		Their record hashes are kept only if the template is unchanged, so an
+		incremental run never mistakes them for current documents.
+
+		Args:
+			previous (CorpusManifest): Manifest of the previous run
+			output_dir (str): Output directory of both runs
+		"""
+		same_template = previous.template_hash == self.template_hash
+		for filename in previous.orphans(self):
+			if os.path.exists(os.path.join(output_dir, filename)):
+				self.documents[filename] = previous.documents[filename] if same_template else None
+
+	def orphans(self, current):
+		"""
+		List documents in this manifest that are no longer part of the corpus.
+
+		Args:
+			current (CorpusManifest): Manifest of the new run
+
+		Returns:
+			list: Filenames to delete
+		"""
+		return [filename for filename in self.documents if filename not in current.documents]
@@ -0,0 +1,221 @@
+"""Render service document PDFs across a pool of worker processes."""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import os
+import resource
+import statistics
+import sys
+from .pdf_generator import ServiceDocumentPDFGenerator
+from .records import catalog_tables, decode_record
+from .shared_catalog import SPEC_FIELDS, SharedCatalog, record_spec
+
+
+# Per-process PDF generator and shared catalog, set up once by the pool initializer
+_pdf_gen = None
+_catalog = None
+
+
+def current_rss():
+	"""
+	Return the resident set size of the current process.
+
+	Returns:
+		int: Resident memory in bytes
+	"""
+	try:
+		with open("/proc/self/statm") as f:
+			return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+	except OSError:
+		# No procfs: fall back to the peak RSS, reported in KB on Linux and bytes on macOS
+		peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+		return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemoryStats:
+	"""Peak and steady-state memory of the rendering processes."""
+
+	def __init__(self, window=200):
+		"""
+		Initialize the statistics.
+
+		Args:
+			window (int): Number of most recent samples the steady state is taken over
+		"""
+		self.peak = 0
+		self.samples = 0
+		self._recent = deque(maxlen=window)
+
+	def add(self, rss):
+		"""Record the RSS (bytes) of a process right after it rendered a document."""
+		self.peak = max(self.peak, rss)
+		self.samples += 1
+		self._recent.append(rss)
+
+	@property
+	def steady_state(self):
+		"""Median RSS over the most recent samples, in bytes."""
+		return int(statistics.median(self._recent)) if self._recent else 0
+
+
+def _init_worker(output_dir, engine, cache_dir, catalog_name):
+	"""Create the PDF generator used by this worker process and attach to the catalog."""
+	global _pdf_gen, _catalog
+	_pdf_gen = ServiceDocumentPDFGenerator(
+		output_dir=output_dir, engine=engine, cache_dir=cache_dir
+	)
+	_catalog = SharedCatalog.attach(catalog_name)
+
+
+def _render(task, filename):
+	"""
+	Render a single document inside a worker process, reporting the worker's RSS.
+
+	``task`` is a record spec resolved against the shared catalog, or a whole
+	record for records the catalog cannot encode.
+	"""
+	data = _catalog.record(task) if task.__class__ is tuple else task
+	return _pdf_gen.generate_pdf(data, filename), current_rss()
+
+
+class RenderPool:
+	"""
+	Render service documents in parallel, yielding results in submission order.
+
+	The catalog is encoded once into a SharedCatalog that every worker
+	attaches to, so a document is sent to its worker as a record spec of
+	catalog codes and client strings rather than as a pickled record.
+	"""
+
+	def __init__(
+		self,
+		output_dir="output",
+		engine="markdown",
+		cache_dir=None,
+		workers=None,
+		max_pending=None,
+		max_tasks_per_child=None,
+		max_rss=None,
+	):
+		"""
+		Initialize the worker pool.
+
+		Args:
+			output_dir (str): Directory to save generated PDFs
+			engine (str): Render engine used by every worker
+			cache_dir (str, optional): Render cache directory shared by the workers
+			workers (int, optional): Number of worker processes. Defaults to the CPU count.
+			max_pending (int, optional): Maximum number of documents queued or in
+				flight at once. Defaults to four per worker.
+			max_tasks_per_child (int, optional): Replace the worker processes after
+				each of them has rendered this many documents on average
+			max_rss (int, optional): Replace the worker processes once one of them
+				reports a resident set size above this many bytes
+		"""
+		self.output_dir = output_dir
+		self.workers = workers or os.cpu_count() or 1
+		self.max_pending = max_pending or self.workers * 4
+		self.max_tasks_per_child = max_tasks_per_child
+		self.max_rss = max_rss
+		self.memory = MemoryStats()
+		self.recycles = 0
+		self._submitted = 0
+		self.catalog = SharedCatalog.create()
+		self._initargs = (output_dir, engine, cache_dir, self.catalog.name)
+		self._executor = self._start_executor()
+
+	def _start_executor(self):
+		"""Start a fresh set of worker processes."""
+		return ProcessPoolExecutor(
+			max_workers=self.workers,
+			initializer=_init_worker,
+			initargs=self._initargs,
+		)
+
+	def _recycle(self):
+		"""
+		Replace all worker processes.
+
+		The old pool finishes the documents already submitted to it before its
+		processes exit, so no document is lost or rendered twice.
+		"""
+		self._executor.shutdown(wait=True)
+		self._executor = self._start_executor()
+		self._submitted = 0
+		self.recycles += 1
+
+	def render(self, tasks, skip=None):
+		"""
+		Render documents in the pool.
+
+		Only ``max_pending`` documents are held in memory at a time, so ``tasks``
+		can be a lazy generator of any length.
+
+		Args:
+			tasks (iterable): (data, filename) pairs
+			skip (callable, optional): ``skip(data, filename)`` returns True for
+				documents that are already up to date and should not be rendered
+
+		Yields:
+			tuple: (data, filepath, skipped) for each document, in the order of
+				``tasks``; ``skipped`` tells whether ``skip`` kept the document
+		"""
+		pending = deque()
+		for data, filename in tasks:
+			skipped = skip is not None and skip(data, filename)
+			if skipped:
+				future = Future()
+				future.set_result((os.path.join(self.output_dir, filename), None))
+			else:
+				# Counted here rather than with ProcessPoolExecutor's own
+				# max_tasks_per_child, which can deadlock a single-worker pool
+				if (
+					self.max_tasks_per_child
+					and self._submitted >= self.max_tasks_per_child * self.workers
+				):
+					self._recycle()
+				future = self._executor.submit(_render, self._task(data), filename)
+				self._submitted += 1
+			pending.append((data, future, self.recycles, skipped))
+			if len(pending) >= self.max_pending:
+				yield self._collect(*pending.popleft())
+
+		while pending:
+			yield self._collect(*pending.popleft())
+
+	@staticmethod
+	def _task(data):
+		"""
+		Encode a record as a record spec.
+
+		Records with texts or values that are not the catalog's, such as varied
+		problem descriptions, are sent whole: a spec must decode to exactly
+		the record, so the document is rendered identically.
+		"""
+		tables = catalog_tables()
+		try:
+			spec = record_spec(data, tables)
+		except ValueError:
+			return data
+		return spec if decode_record(dict(zip(SPEC_FIELDS, spec)), tables) == data else data
+
+	def _collect(self, data, future, generation, skipped):
+		"""Wait for a document and record the memory of the worker that rendered it."""
+		filepath, rss = future.result()
+		if rss is not None:
+			self.memory.add(rss)
+			# Documents rendered by an already replaced pool do not trigger another restart
+			if self.max_rss and rss > self.max_rss and generation == self.recycles:
+				self._recycle()
+		return data, filepath, skipped
+
+	def close(self):
+		"""Shut down the worker processes and free the shared catalog."""
+		self._executor.shutdown(cancel_futures=True)
+		self.catalog.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc, tb):
+		self.close()
@@ -0,0 +1,185 @@
+"""Normalized table of the catalog's parts with an inverted token index."""
+
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from .issue_store import ISSUES_FILE, catalog_revision, service_issues
+from .sku_index import part_sku
+
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# The space before a description's specs: before a measurement (a word with a
+# digit) or a "with"/"for" clause
+_SPECS = re.compile(r" (?=\S*\d|(?:with|for)(?: |$))", re.IGNORECASE)
+
+
+def tokenize(text):
+	"""
+	Split text into the search tokens of the index.
+
+	Tokens are lowercased runs of letters and digits. A plural "s" is dropped,
+	so "thermocouples" finds "Thermocouple".
+
+	Args:
+		text (str): Part text or search keywords
+
+	Returns:
+		list: Tokens, in text order
+	"""
+	return [
+		token[:-1] if len(token) > 3 and token[-1] == "s" and token[-2] != "s" else token
+		for token in _TOKEN.findall(text.lower())
+	]
+
+
+def parse_part(part):
+	"""
+	Split a part string into its fields.
+
+	The description is split at its first measurement (a word with a digit)
+	or its first "with"/"for" clause: "Thermocouple Type K 18-inch with
+	1/4-inch NPT fitting" is named "Thermocouple Type K" with specs
+	"18-inch with 1/4-inch NPT fitting".
+
+	Args:
+		part (str): Part as listed in an issue
+
+	Returns:
+		dict: "text", "sku", "family", "name" and "specs"; "sku" and
+			"family" are None for parts without a SKU
+	"""
+	sku = part_sku(part)
+	description = part.split(" - ", 1)[1] if sku and " - " in part else ("" if sku else part)
+	description = " ".join(description.split())
+	# Skip the first word, so a name is never empty
+	match = _SPECS.search(description, 1)
+	split = match.start() if match else len(description)
+	family = sku.split("-")[1].upper() if sku and sku.count("-") >= 2 else None
+	return {
+		"text": part,
+		"sku": sku,
+		"family": family,
+		"name": description[:split],
+		"specs": description[split + 1:],
+	}
+
+
+def _contains(ids, p):
+	"""Whether the sorted list ``ids`` contains ``p``."""
+	k = bisect_left(ids, p)
+	return k < len(ids) and ids[k] == p
+
+
+class PartCatalog:
+	"""
+	Every distinct part of the catalog, once, with the issues that use it.
+
+	``parts[p]`` is part ``p``: its fields from ``parse_part`` plus "issues",
+	the ids of the issues listing it. Issue ids number the catalog's issues in
+	order across categories, like ``records.catalog_tables``; ``issues[i]`` is
+	the (category, issue) of id ``i``.
+
+	The inverted index maps each token of a part's SKU, name and specs to the
+	sorted ids of the parts containing it, so a keyword search intersects a
+	few short lists instead of scanning every part.
+	"""
+
+	def __init__(self, issues):
+		"""
+		Build the catalog.
+
+		Args:
+			issues (dict): Machine category -> list of issues, as returned by
+				``issue_store.service_issues``
+		"""
+		self.issues = [
+			(category, issue) for category, category_issues in issues.items() for issue in category_issues
+		]
+		self.parts = []
+		part_ids = {}
+		for i, (_, issue) in enumerate(self.issues):
+			for part in issue["parts"]:
+				p = part_ids.get(part)
+				if p is None:
+					p = part_ids[part] = len(self.parts)
+					self.parts.append({**parse_part(part), "issues": []})
+				if not self.parts[p]["issues"] or self.parts[p]["issues"][-1] != i:
+					self.parts[p]["issues"].append(i)
+
+		self.tokens = {}
+		self.families = {}
+		for p, part in enumerate(self.parts):
+			text = " ".join(filter(None, (part["sku"], part["name"], part["specs"])))
+			for token in dict.fromkeys(tokenize(text)):
+				self.tokens.setdefault(token, []).append(p)
+			if part["family"]:
+				self.families.setdefault(part["family"], []).append(p)
+
+	def __len__(self):
+		return len(self.parts)
+
+	def search(self, keywords):
+		"""
+		Find the parts containing every keyword.
+
+		Args:
+			keywords (str): Words to search for, e.g. "thermocouple 24-inch"
+
+		Returns:
+			list: Ids of the matching parts, in catalog order
+		"""
+		postings = sorted(
+			(self.tokens.get(token, []) for token in dict.fromkeys(tokenize(keywords))), key=len
+		)
+		if not postings:
+			return []
+		# Look the shortest list's parts up in the others by binary search,
+		# so common tokens like "inch" cost little
+		matches = list(postings[0])
+		for other in postings[1:]:
+			matches = [p for p in matches if _contains(other, p)]
+		return matches
+
+	def family(self, code):
+		"""
+		Find the parts of a family.
+
+		Args:
+			code (str): Family code, the middle of a SKU, e.g. "TC"
+
+		Returns:
+			list: Ids of the family's parts, in catalog order
+		"""
+		return list(self.families.get(code.upper(), []))
+
+	def usages(self, part):
+		"""
+		List the issues using a part.
+
+		Args:
+			part (int): Part id
+
+		Returns:
+			list: (category, issue, part text) tuples, as ``SkuIndex`` lookups return
+		"""
+		text = self.parts[part]["text"]
+		return [(*self.issues[i], text) for i in self.parts[part]["issues"]]
+
+
+@lru_cache(maxsize=1)
+def _catalog(path, revision):
+	return PartCatalog(service_issues(path))
+
+
+def part_catalog(path=ISSUES_FILE):
+	"""
+	Return the part catalog, built once per catalog revision.
+
+	Args:
+		path (str): Issue file
+
+	Returns:
+		PartCatalog: The catalog
+	"""
+	return _catalog(path, catalog_revision(path))
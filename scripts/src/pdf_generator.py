@@ -1,24 +1,56 @@
-"""Generate professional-looking service document PDFs using Markdown and WeasyPrint."""
+"""Generate professional-looking service document PDFs with a pluggable render engine."""
 
-import markdown
-from weasyprint import HTML, CSS
 from datetime import datetime
 import os
+import shutil
+from .render_cache import RenderCache
+
+
+# Render engines, selectable by name:
+#   markdown  - Markdown converted to HTML, laid out by WeasyPrint
+#   html      - precompiled HTML template, laid out by WeasyPrint
+#   reportlab - fixed layout drawn directly on a ReportLab canvas
+ENGINES = ("markdown", "html", "reportlab")
+
+
+def create_engine(name):
+	"""
+	Create a render engine by name.
+
+	Engines are imported on demand, so only the selected backend is loaded.
+
+	Args:
+		name (str): One of ENGINES
+
+	Returns:
+		RenderEngine: The engine instance
+	"""
+	if name in ("markdown", "html"):
+		from .weasyprint_engine import WeasyPrintEngine
+		return WeasyPrintEngine(template=name)
+	if name == "reportlab":
+		from .reportlab_engine import ReportLabEngine
+		return ReportLabEngine()
+	raise ValueError(f"Unknown engine '{name}', expected one of: {', '.join(ENGINES)}")
 
 
 class ServiceDocumentPDFGenerator:
-	"""Generate professional-looking service document PDFs from Markdown."""
+	"""Generate professional-looking service document PDFs."""
 
-	def __init__(self, output_dir="output"):
+	def __init__(self, output_dir="output", engine="markdown", cache_dir=None):
 		"""
 		Initialize the PDF generator.
 
 		Args:
 			output_dir (str): Directory to save generated PDFs
+			engine (str): Render engine, one of ENGINES
+			cache_dir (str, optional): Directory of a content-addressed render
+				cache. Records already rendered with the same engine output are
+				copied from the cache instead of being laid out again.
 		"""
 		self.output_dir = output_dir
-		self.css = self._get_stylesheet()
-		self.md = markdown.Markdown(extensions=["tables"])
+		self.engine = create_engine(engine)
+		self.cache = RenderCache(cache_dir, self.engine) if cache_dir else None
 
 	def generate_pdf(self, data, filename=None):
 		"""
@@ -36,188 +68,107 @@ class ServiceDocumentPDFGenerator:
 			filename = f"service_doc_{timestamp}.pdf"
 
 		filepath = os.path.join(self.output_dir, filename)
-
-		# Generate markdown content
-		md_content = self._generate_markdown(data)
-
-		# Convert markdown to HTML
-		html_body = self.md.convert(md_content)
-		self.md.reset()  # Reset for next conversion
-
-		# Wrap in full HTML document
-		html_content = f"""
-		<!DOCTYPE html>
-		<html>
-		<head>
-			<meta charset="utf-8">
-			<title>Service Report - {data['work_order']}</title>
-		</head>
-		<body>
-			{html_body}
-		</body>
-		</html>
-		"""
-
-		# Render to PDF
-		HTML(string=html_content).write_pdf(filepath, stylesheets=[CSS(string=self.css)])
-
-		return filepath
-
-	def _generate_markdown(self, data):
-		"""Generate markdown content from service data."""
-		# Format the date
-		service_date = data["service_date"]
-		if hasattr(service_date, "strftime"):
-			date_str = service_date.strftime("%m/%d/%Y")
+		if self.cache is None:
+			self.write_pdf(data, filepath)
 		else:
-			date_str = str(service_date)
-
-		# Format address (replace newlines with comma-space for inline display)
-		address = data["client_address"].replace("\n", ", ")
-
-		# Format parts list
-		if data["parts_used"]:
-			parts = data["parts_used"].split(", ")
-			parts_list = "\n".join(f"- {part}" for part in parts)
-		else:
-			parts_list = "- No parts replaced"
-
-		# Build markdown document
-		md_content = f"""# {data['company']}
-
-## SERVICE REPORT
-
-**Work Order:** {data['work_order']} | **Date:** {date_str}
-
----
-
-## Client Information
-
-| | |
-|---|---|
-| **Client** | {data['client_name']} |
-| **Address** | {address} |
-| **Phone** | {data['client_phone']} |
-
-## Equipment Information
-
-| Field | Value |
-|-------|-------|
-| Machine Type | {data['machine_type']} |
-| Model | {data['machine_model']} |
-| Serial Number | {data['serial_number']} |
-
-## Service Details
-
-### Problem Description
+			shutil.copyfile(self._cached_path(data), filepath)
 
-{data['problem_description']}
-
-### Solution Applied
-
-{data['solution_applied']}
-
-## Parts Used
-
-{parts_list}
-
-## Technician Information
-
-| | |
-|---|---|
-| **Technician Name** | {data['technician']['name']} |
-| **Technician ID** | {data['technician']['id']} |
-| **Certification** | {data['technician']['cert']} |
-| **Arrival Time** | {data['arrival_time']} |
-| **Labor Hours** | {data['labor_hours']} |
+		return filepath
 
----
+	def render_pdf(self, data):
+		"""
+		Render a service document PDF in memory.
 
-**Technician Signature:** _______________________________ **Date:** _______________
+		Args:
+			data (dict): Service record data from ServiceDocumentDataGenerator
 
----
+		Returns:
+			bytes: The rendered PDF
+		"""
+		return self.write_pdf(data)
 
-*{data['company']} | 24/7 Service | (555) 123-4567*
+	def write_pdf(self, data, target=None):
+		"""
+		Render a service document PDF to a path or a writable sink.
 
-*www.foodservicetech.com | service@foodservicetech.com*
-"""
-		return md_content
+		Args:
+			data (dict): Service record data from ServiceDocumentDataGenerator
+			target (str or file object, optional): Path, or any object with a
+				``write`` method (open file, BytesIO, socket file, upload stream).
+				If None, the PDF is returned instead of written.
 
-	def _get_stylesheet(self):
-		"""Return CSS stylesheet for PDF rendering."""
-		return """
-		@page {
-			size: letter;
-			margin: 0.75in;
-		}
+		Returns:
+			bytes: The rendered PDF if ``target`` is None, otherwise None
+		"""
+		if self.cache is None:
+			return self.engine.write_pdf(data, target)
+
+		with open(self._cached_path(data), "rb") as f:
+			pdf = f.read()
+		if target is None:
+			return pdf
+		if hasattr(target, "write"):
+			target.write(pdf)
+		else:
+			with open(target, "wb") as f:
+				f.write(pdf)
+		return None
 
-		body {
-			font-family: Helvetica, Arial, sans-serif;
-			font-size: 10pt;
-			line-height: 1.4;
-			color: #333;
-		}
+	def render_batch(self, records):
+		"""
+		Render several service documents, one PDF per record.
 
-		h1 {
-			font-size: 18pt;
-			margin-bottom: 0.25em;
-			color: #222;
-		}
+		With the WeasyPrint engines the records are laid out in a single pass
+		and split back into one PDF per record by page range, paying the fixed
+		per-call parse and cascade cost once per batch.
 
-		h2 {
-			font-size: 14pt;
-			margin-top: 1.25em;
-			margin-bottom: 0.5em;
-			padding-bottom: 0.25em;
-			border-bottom: 1px solid #ccc;
-		}
+		Args:
+			records (list): Service record data dicts
 
-		h3 {
-			font-size: 11pt;
-			margin-top: 1em;
-			margin-bottom: 0.25em;
-		}
+		Returns:
+			list: One PDF (bytes) per record, in the order of ``records``
+		"""
+		if self.cache is None:
+			return self.engine.render_batch(records)
+
+		# Only lay out the records that are not cached yet
+		keys = [self.cache.key(data) for data in records]
+		paths = [self.cache.get(key) for key in keys]
+		missing = [i for i, path in enumerate(paths) if path is None]
+		rendered = self.engine.render_batch([records[i] for i in missing])
+		for i, pdf in zip(missing, rendered):
+			paths[i] = self.cache.put(keys[i], pdf)
+
+		pdfs = []
+		for path in paths:
+			with open(path, "rb") as f:
+				pdfs.append(f.read())
+		return pdfs
+
+	def generate_batch(self, records, filenames):
+		"""
+		Generate service document PDFs for several records in one layout pass.
 
-		p {
-			margin: 0.5em 0;
-		}
+		Args:
+			records (list): Service record data dicts
+			filenames (list): Output filename for each record
 
-		table {
-			width: 100%;
-			border-collapse: collapse;
-			margin: 0.5em 0;
-		}
-
-		th, td {
-			border: 1px solid #ddd;
-			padding: 0.4em 0.6em;
-			text-align: left;
-			vertical-align: top;
-		}
-
-		th {
-			background-color: #f5f5f5;
-			font-weight: bold;
-		}
-
-		hr {
-			border: none;
-			border-top: 1px solid #ccc;
-			margin: 1em 0;
-		}
-
-		ul {
-			margin: 0.5em 0;
-			padding-left: 1.5em;
-		}
-
-		li {
-			margin: 0.25em 0;
-		}
-
-		em {
-			font-style: italic;
-			color: #666;
-			font-size: 9pt;
-		}
+		Returns:
+			list: Paths to the generated PDF files
 		"""
+		filepaths = []
+		for pdf, filename in zip(self.render_batch(records), filenames):
+			filepath = os.path.join(self.output_dir, filename)
+			with open(filepath, "wb") as f:
+				f.write(pdf)
+			filepaths.append(filepath)
+
+		return filepaths
+
+	def _cached_path(self, data):
+		"""Return the cached PDF for ``data``, rendering it into the cache on a miss."""
+		key = self.cache.key(data)
+		path = self.cache.get(key)
+		if path is None:
+			path = self.cache.put(key, self.engine.write_pdf(data))
+		return path
@@ -0,0 +1,340 @@
+"""Compact service record types: a slotted record and columnar record batches."""
+
+from collections.abc import Mapping
+from datetime import date
+from functools import lru_cache
+import numpy as np
+from .constants import MACHINE_CATEGORIES, TECHNICIANS, COMPANIES
+from .issue_store import service_issues
+
+
+# Fields of a service record, in document order
+RECORD_FIELDS = (
+	"machine_model",
+	"machine_type",
+	"problem_description",
+	"solution_applied",
+	"parts_used",
+	"client_name",
+	"service_date",
+	"serial_number",
+	"work_order",
+	"technician",
+	"company",
+	"client_address",
+	"client_phone",
+	"arrival_time",
+	"duration_minutes",
+	"labor_hours",
+)
+
+# Parts stored per record in a RecordBatch
+MAX_PARTS = 3
+
+# Client fields stored as strings in a RecordBatch
+CLIENT_FIELDS = ("client_name", "client_address", "client_phone")
+
+# Issue texts, stored as strings in a RecordBatch only when they are not the
+# catalog's own (e.g. from a text source)
+TEXT_FIELDS = ("problem_description", "solution_applied")
+
+
+@lru_cache(maxsize=None)
+def catalog_tables():
+	"""
+	Number the catalog entries records refer to.
+
+	Issues are numbered across all categories in catalog order; each category's
+	issues occupy ``issue_offsets[c]`` to ``issue_offsets[c] + issue_counts[c]``.
+	Models are numbered within their category and parts within their issue.
+
+	Returns:
+		dict: Category names, models and issues, the NumPy index arrays used
+			for vectorized sampling, and reverse lookups from values to codes
+	"""
+	categories = list(MACHINE_CATEGORIES)
+	catalog = service_issues()
+	issues = [issue for category in categories for issue in catalog[category]]
+	issue_counts = np.array([len(catalog[c]) for c in categories])
+	issue_offsets = np.concatenate(([0], np.cumsum(issue_counts)[:-1]))
+	part_counts = np.array([len(issue["parts"]) for issue in issues])
+	return {
+		"categories": categories,
+		"models": [MACHINE_CATEGORIES[c]["models"] for c in categories],
+		"model_counts": np.array([len(MACHINE_CATEGORIES[c]["models"]) for c in categories]),
+		"issues": issues,
+		"issue_counts": issue_counts,
+		"issue_offsets": issue_offsets,
+		"part_counts": part_counts,
+		"max_parts": int(part_counts.max()),
+		"category_codes": {category: c for c, category in enumerate(categories)},
+		"model_codes": [
+			{model: m for m, model in enumerate(MACHINE_CATEGORIES[c]["models"])}
+			for c in categories
+		],
+		"issue_codes": {
+			(category, issue["problem"], issue["solution"]): int(issue_offsets[c]) + i
+			for c, category in enumerate(categories)
+			for i, issue in enumerate(catalog[category])
+		},
+		"technicians": TECHNICIANS,
+		"companies": COMPANIES,
+		"technician_codes": {technician["id"]: t for t, technician in enumerate(TECHNICIANS)},
+		"company_codes": {company: c for c, company in enumerate(COMPANIES)},
+	}
+
+
+def encode_record(record, tables=None):
+	"""
+	Encode a service record into catalog codes.
+
+	Problem and solution texts must be the catalog's own, since they
+	identify the issue.
+
+	Args:
+		record (Mapping): Record dict or ServiceRecord
+		tables (dict, optional): Catalog tables. Defaults to ``catalog_tables()``.
+
+	Returns:
+		dict: One plain value per RecordBatch.DTYPES entry (``parts`` as a
+			list of MAX_PARTS part codes) and one string per CLIENT_FIELDS entry
+
+	Raises:
+		ValueError: If the record refers to values that are not in the catalog
+	"""
+	tables = tables or catalog_tables()
+	try:
+		category = tables["category_codes"][record["machine_type"]]
+		issue = tables["issue_codes"][
+			(record["machine_type"], record["problem_description"], record["solution_applied"])
+		]
+		part_codes = {part: p for p, part in enumerate(tables["issues"][issue]["parts"])}
+		parts = [part_codes[part] for part in (record["parts_used"] or "").split(", ") if part]
+		model = tables["model_codes"][category][record["machine_model"]]
+		technician = tables["technician_codes"][record["technician"]["id"]]
+		company = tables["company_codes"][record["company"]]
+	except KeyError as e:
+		raise ValueError(f"Record refers to {e} which is not in the catalog") from None
+	if len(parts) > MAX_PARTS:
+		raise ValueError(f"Record uses {len(parts)} parts, at most {MAX_PARTS} are supported")
+	hours, minutes = record["arrival_time"].split(":")
+	row = {
+		"category": category,
+		"model": model,
+		"issue": issue,
+		"parts": parts + [-1] * (MAX_PARTS - len(parts)),
+		"service_date": record["service_date"].toordinal(),
+		"technician": technician,
+		"company": company,
+		"serial": int(record["serial_number"][2:]),
+		"work_order": int(record["work_order"][3:]),
+		"arrival": int(hours) * 60 + int(minutes),
+		"duration": record["duration_minutes"],
+	}
+	row.update({name: record[name] for name in CLIENT_FIELDS})
+	return row
+
+
+def decode_record(row, tables=None):
+	"""
+	Resolve a row of catalog codes into a ServiceRecord.
+
+	Args:
+		row (Mapping): One value per RecordBatch column, as ``encode_record``
+			returns or a RecordBatch stores. Problem and solution texts are
+			taken from the row when it has them, otherwise from the catalog.
+		tables (dict, optional): Catalog tables, or any mapping with the same
+			"categories", "models", "issues", "technicians" and "companies"
+			sequences. Defaults to ``catalog_tables()``.
+
+	Returns:
+		ServiceRecord: The record
+	"""
+	tables = tables or catalog_tables()
+	category = int(row["category"])
+	issue = tables["issues"][int(row["issue"])]
+	parts = [issue["parts"][int(p)] for p in row["parts"] if p >= 0]
+	# Plain ints: NumPy scalars are slow to format
+	arrival = int(row["arrival"])
+	duration = int(row["duration"])
+	return ServiceRecord(
+		machine_model=tables["models"][category][int(row["model"])],
+		machine_type=tables["categories"][category],
+		problem_description=row.get("problem_description", issue["problem"]),
+		solution_applied=row.get("solution_applied", issue["solution"]),
+		parts_used=", ".join(parts) if parts else None,
+		client_name=row["client_name"],
+		service_date=date.fromordinal(int(row["service_date"])),
+		serial_number=f"SN{int(row['serial'])}",
+		work_order=f"WO-{int(row['work_order'])}",
+		technician=tables["technicians"][int(row["technician"])],
+		company=tables["companies"][int(row["company"])],
+		client_address=row["client_address"],
+		client_phone=row["client_phone"],
+		arrival_time=f"{arrival // 60:02d}:{arrival % 60:02d}",
+		duration_minutes=duration,
+		labor_hours=round(duration / 60, 2),
+	)
+
+
+class ServiceRecord(Mapping):
+	"""
+	A service record with one slot per field.
+
+	Reads like the record dicts the renderers take (``record["client_name"]``,
+	``record.get(...)``, ``dict(record)``) without a per-record hash table.
+	"""
+
+	__slots__ = RECORD_FIELDS
+
+	def __init__(self, **fields):
+		"""
+		Initialize the record.
+
+		Args:
+			**fields: One value per RECORD_FIELDS entry
+		"""
+		for name in RECORD_FIELDS:
+			setattr(self, name, fields[name])
+
+	def __getitem__(self, name):
+		if name not in RECORD_FIELDS:
+			raise KeyError(name)
+		return getattr(self, name)
+
+	def __setitem__(self, name, value):
+		if name not in RECORD_FIELDS:
+			raise KeyError(name)
+		setattr(self, name, value)
+
+	def __iter__(self):
+		return iter(RECORD_FIELDS)
+
+	def __len__(self):
+		return len(RECORD_FIELDS)
+
+	def __repr__(self):
+		return f"ServiceRecord({dict(self)!r})"
+
+
+class RecordBatch:
+	"""
+	Service records stored column by column.
+
+	Category, model, issue, parts, technician and company are small integer
+	codes into the catalog (see ``catalog_tables``); dates, times and numbers
+	are integers. Catalog strings are only looked up when a record is read,
+	typically right before rendering. Client names, addresses and phone
+	numbers are kept as lists of strings, and so are problem and solution
+	texts when a batch has its own.
+	"""
+
+	# Integer columns and their dtypes. ``parts`` holds MAX_PARTS part codes
+	# per record, padded with -1. Issue and part codes are wide enough for
+	# catalogs of millions of issues and thousands of parts per issue.
+	DTYPES = {
+		"category": np.uint8,
+		"model": np.uint8,
+		"issue": np.uint32,
+		"parts": np.int16,
+		"service_date": np.int32,
+		"technician": np.uint8,
+		"company": np.uint8,
+		"serial": np.uint32,
+		"work_order": np.uint32,
+		"arrival": np.uint16,
+		"duration": np.uint16,
+	}
+
+	def __init__(self, columns):
+		"""
+		Initialize the batch.
+
+		Args:
+			columns (dict): One array per DTYPES entry (service dates as
+				ordinals, arrival as minutes after midnight) and one list per
+				CLIENT_FIELDS entry, all of the same length. Optionally one
+				list per TEXT_FIELDS entry, overriding the issue's catalog texts.
+
+		Raises:
+			ValueError: If a column has values its dtype cannot hold
+		"""
+		self.columns = {}
+		for name, dtype in self.DTYPES.items():
+			column = np.asarray(columns[name])
+			# Casting would silently wrap out-of-range codes to other values
+			if column.size and column.dtype != dtype:
+				limits = np.iinfo(dtype)
+				if column.min() < limits.min or column.max() > limits.max:
+					raise ValueError(f"Column '{name}' has values outside the range of {np.dtype(dtype).name}")
+			self.columns[name] = column.astype(dtype, copy=False)
+		self.columns.update({name: list(columns[name]) for name in CLIENT_FIELDS})
+		self.columns.update({name: list(columns[name]) for name in TEXT_FIELDS if name in columns})
+
+	@classmethod
+	def from_records(cls, records):
+		"""
+		Encode service records.
+
+		Problem and solution texts must be the catalog's own, since they
+		identify the issue.
+
+		Args:
+			records (list): Record dicts or ServiceRecords
+
+		Returns:
+			RecordBatch: The encoded records
+
+		Raises:
+			ValueError: If a record refers to values that are not in the catalog
+		"""
+		tables = catalog_tables()
+		columns = {name: [] for name in (*cls.DTYPES, *CLIENT_FIELDS)}
+		for record in records:
+			for name, value in encode_record(record, tables).items():
+				columns[name].append(value)
+		if not columns["parts"]:
+			columns["parts"] = np.empty((0, MAX_PARTS))
+		return cls(columns)
+
+	@classmethod
+	def concatenate(cls, batches):
+		"""Join batches into one, in order."""
+		columns = {name: np.concatenate([b.columns[name] for b in batches]) for name in cls.DTYPES}
+		for name in CLIENT_FIELDS:
+			columns[name] = [value for b in batches for value in b.columns[name]]
+		for name in TEXT_FIELDS:
+			if name in batches[0].columns:
+				columns[name] = [value for b in batches for value in b.columns[name]]
+		return cls(columns)
+
+	def __len__(self):
+		return len(self.columns["category"])
+
+	def __getitem__(self, index):
+		"""
+		Read records.
+
+		Args:
+			index (int or slice): Record position, or a range of records
+
+		Returns:
+			ServiceRecord or RecordBatch: The record with its catalog strings
+				resolved, or a batch of the selected records
+		"""
+		if isinstance(index, slice):
+			return RecordBatch({name: column[index] for name, column in self.columns.items()})
+
+		return decode_record({name: column[index] for name, column in self.columns.items()})
+
+	def __iter__(self):
+		# Whole columns converted to lists are much faster to walk than NumPy
+		# arrays indexed record by record
+		names = list(self.columns)
+		columns = [
+			column.tolist() if isinstance(column, np.ndarray) else column
+			for column in self.columns.values()
+		]
+		tables = catalog_tables()
+		for row in zip(*columns):
+			yield decode_record(dict(zip(names, row)), tables)
@@ -0,0 +1,82 @@
+"""Content-addressed on-disk cache of rendered service document PDFs."""
+
+import hashlib
+import json
+import os
+import tempfile
+
+
+def record_fingerprint(data):
+	"""
+	Hash a service record's content.
+
+	Args:
+		data (dict or ServiceRecord): Service record data from ServiceDocumentDataGenerator
+
+	Returns:
+		str: Hex digest of the record's canonical JSON form
+	"""
+	canonical = json.dumps(dict(data), sort_keys=True, separators=(",", ":"), default=str)
+	return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class RenderCache:
+	"""Store rendered PDFs keyed by record content and engine output fingerprint."""
+
+	def __init__(self, cache_dir, engine):
+		"""
+		Initialize the cache.
+
+		Args:
+			cache_dir (str): Directory holding cached PDFs, shared between runs
+			engine (RenderEngine): Engine whose output is cached. Its fingerprint
+				covers the template, stylesheet and library version, so a layout
+				change never serves stale PDFs.
+		"""
+		self.cache_dir = cache_dir
+		self.template_hash = engine.fingerprint()
+		self.hits = 0
+		self.misses = 0
+		os.makedirs(cache_dir, exist_ok=True)
+
+	def key(self, data):
+		"""Return the cache key for rendering ``data`` with this cache's engine."""
+		digest = hashlib.sha256(self.template_hash.encode())
+		digest.update(record_fingerprint(data).encode())
+		return digest.hexdigest()
+
+	def path(self, key):
+		"""Return the file path for a cache key."""
+		return os.path.join(self.cache_dir, key[:2], f"{key}.pdf")
+
+	def get(self, key):
+		"""
+		Look up a cached PDF.
+
+		Returns:
+			str: Path to the cached PDF, or None on a miss
+		"""
+		path = self.path(key)
+		if os.path.exists(path):
+			self.hits += 1
+			return path
+		self.misses += 1
+		return None
+
+	def put(self, key, pdf):
+		"""
+		Store a rendered PDF.
+
+		The file is written under a temporary name and renamed into place, so
+		concurrent workers never see a partial PDF.
+
+		Returns:
+			str: Path to the cached PDF
+		"""
+		path = self.path(key)
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+		fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+		with os.fdopen(fd, "wb") as f:
+			f.write(pdf)
+		os.replace(tmp_path, path)
+		return path
@@ -0,0 +1,360 @@
+"""Render service document PDFs with a fixed layout drawn on a ReportLab canvas."""
+
+from reportlab.lib.colors import HexColor
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen.canvas import Canvas
+from functools import lru_cache
+import io
+import os
+from .render_engine import RenderEngine, format_address, format_date, split_parts
+
+
+PAGE_WIDTH, PAGE_HEIGHT = letter
+MARGIN = 0.75 * inch
+CONTENT_WIDTH = PAGE_WIDTH - 2 * MARGIN
+
+# Fonts and colors matching the WeasyPrint stylesheet. The standard PDF fonts
+# need no embedding and their text stays extractable.
+FONT = "Helvetica"
+BOLD_FONT = "Helvetica-Bold"
+ITALIC_FONT = "Helvetica-Oblique"
+FONT_SIZE = 10
+LINE_HEIGHT = 1.4
+TEXT_COLOR = HexColor("#333333")
+HEADING_COLOR = HexColor("#222222")
+MUTED_COLOR = HexColor("#666666")
+RULE_COLOR = HexColor("#cccccc")
+BORDER_COLOR = HexColor("#dddddd")
+HEADER_FILL = HexColor("#f5f5f5")
+
+CELL_PADDING_X = 6
+CELL_PADDING_Y = 4
+LABEL_COLUMN_WIDTH = CONTENT_WIDTH * 0.35
+
+# Characters outside the standard fonts' encoding, mapped to a lookalike
+CHARACTER_SUBSTITUTIONS = str.maketrans({"μ": "µ"})
+
+# The standard fonts only encode WinAnsi (cp1252) text. Documents with other
+# characters, e.g. Cyrillic or Greek client details from other locales, are
+# drawn with these TrueType fonts instead, embedded and still extractable.
+# Missing italic or bold files fall back to the regular font.
+UNICODE_FONT_FILES = ("DejaVuSans.ttf", "DejaVuSans-Bold.ttf", "DejaVuSans-Oblique.ttf")
+UNICODE_FONT_DIRS = (
+	"/usr/share/fonts/truetype/dejavu",
+	"/usr/share/fonts/TTF",
+	"/usr/share/fonts/dejavu",
+	"/usr/share/fonts/dejavu-sans-fonts",
+	"/usr/local/share/fonts",
+	"/Library/Fonts",
+	os.path.expanduser("~/Library/Fonts"),
+	"C:/Windows/Fonts",
+)
+
+
+class ReportLabEngine(RenderEngine):
+	"""Draw the service document layout directly, without HTML layout."""
+
+	name = "reportlab"
+
+	def write_pdf(self, data, target=None):
+		"""
+		Render a service document PDF to a path or a writable sink.
+
+		Args:
+			data (dict): Service record data from ServiceDocumentDataGenerator
+			target (str or file object, optional): Path, or any object with a
+				``write`` method. If None, the PDF is returned instead of written.
+
+		Returns:
+			bytes: The rendered PDF if ``target`` is None, otherwise None
+		"""
+		buffer = io.BytesIO() if target is None else target
+		# invariant drops the creation date and random file ID so the same
+		# record always renders to the same bytes
+		fonts = _fonts_for(data)
+		canvas = Canvas(buffer, pagesize=letter, invariant=1)
+		canvas.setTitle(f"Service Report - {data['work_order']}")
+
+		_DocumentLayout(canvas, fonts).draw(data)
+		canvas.save()
+
+		if target is None:
+			return buffer.getvalue()
+		return None
+
+
+class _DocumentLayout:
+	"""Flow the document sections down the page, starting new pages as needed."""
+
+	def __init__(self, canvas, fonts=(FONT, BOLD_FONT, ITALIC_FONT)):
+		self.canvas = canvas
+		self.font, self.bold_font, self.italic_font = fonts
+		self.y = PAGE_HEIGHT - MARGIN
+
+	def draw(self, data):
+		"""Draw the same sections as the Markdown document."""
+		technician = data["technician"]
+
+		self.heading(data["company"], 18, space_before=0, rule=False)
+		self.heading("SERVICE REPORT", 14)
+		self.labeled_line([
+			("Work Order:", f" {data['work_order']} | "),
+			("Date:", f" {format_date(data['service_date'])}"),
+		])
+		self.rule()
+
+		self.heading("Client Information", 14)
+		self.table([
+			("Client", data["client_name"]),
+			("Address", format_address(data["client_address"])),
+			("Phone", data["client_phone"]),
+		])
+
+		self.heading("Equipment Information", 14)
+		self.table(
+			[
+				("Machine Type", data["machine_type"]),
+				("Model", data["machine_model"]),
+				("Serial Number", data["serial_number"]),
+			],
+			header=("Field", "Value"),
+			bold_labels=False,
+		)
+
+		self.heading("Service Details", 14)
+		self.heading("Problem Description", 11, rule=False, space_before=10)
+		self.paragraph(data["problem_description"])
+		self.heading("Solution Applied", 11, rule=False, space_before=10)
+		self.paragraph(data["solution_applied"])
+
+		self.heading("Parts Used", 14)
+		for part in split_parts(data["parts_used"]):
+			self.paragraph(part, bullet=True)
+
+		self.heading("Technician Information", 14)
+		self.table([
+			("Technician Name", technician["name"]),
+			("Technician ID", technician["id"]),
+			("Certification", technician["cert"]),
+			("Arrival Time", data["arrival_time"]),
+			("Labor Hours", str(data["labor_hours"])),
+		])
+
+		self.rule()
+		self.labeled_line([
+			("Technician Signature:", " _______________________________ "),
+			("Date:", " _______________"),
+		])
+		self.rule()
+
+		self.paragraph(
+			f"{data['company']} | 24/7 Service | (555) 123-4567",
+			font=self.italic_font, size=9, color=MUTED_COLOR,
+		)
+		self.paragraph(
+			"www.foodservicetech.com | service@foodservicetech.com",
+			font=self.italic_font, size=9, color=MUTED_COLOR,
+		)
+
+	def ensure_space(self, height):
+		"""
+		Start a new page if ``height`` points do not fit on this one.
+
+		Returns:
+			bool: Whether a page was started, which resets the font and colors
+		"""
+		if self.y - height < MARGIN:
+			self.canvas.showPage()
+			self.y = PAGE_HEIGHT - MARGIN
+			return True
+		return False
+
+	def heading(self, text, size, space_before=None, rule=True):
+		"""Draw a bold heading, optionally underlined like the h2 style."""
+		if space_before is None:
+			space_before = size * 1.25
+		leading = size * 1.2
+		# Keep the heading together with the first lines of its section
+		self.ensure_space(space_before + leading + size * 0.5 + 3 * FONT_SIZE * LINE_HEIGHT)
+		self.y -= space_before + size
+
+		self.canvas.setFillColor(HEADING_COLOR)
+		self.canvas.setFont(self.bold_font, size)
+		self.canvas.drawString(MARGIN, self.y, _text(text))
+		self.y -= leading - size
+
+		if rule:
+			self.y -= size * 0.25
+			self.canvas.setStrokeColor(RULE_COLOR)
+			self.canvas.setLineWidth(0.75)
+			self.canvas.line(MARGIN, self.y, MARGIN + CONTENT_WIDTH, self.y)
+		self.y -= size * 0.5
+
+	def paragraph(self, text, font=None, size=FONT_SIZE, color=TEXT_COLOR, bullet=False):
+		"""Draw a wrapped paragraph, or a bulleted list item."""
+		font = font or self.font
+		indent = 1.5 * FONT_SIZE if bullet else 0
+		leading = size * LINE_HEIGHT
+		lines = simpleSplit(_text(text), font, size, CONTENT_WIDTH - indent)
+
+		self.canvas.setFillColor(color)
+		self.canvas.setFont(font, size)
+		self.y -= size * 0.25 if bullet else size * 0.5
+		for i, line in enumerate(lines):
+			if self.ensure_space(leading):
+				# Lines continued on a new page keep the paragraph's style
+				self.canvas.setFillColor(color)
+				self.canvas.setFont(font, size)
+			self.y -= leading
+			if bullet and i == 0:
+				self.canvas.drawString(MARGIN + indent * 0.4, self.y, "•")
+			self.canvas.drawString(MARGIN + indent, self.y, line)
+		self.y -= size * 0.25 if bullet else size * 0.5
+
+	def labeled_line(self, segments):
+		"""Draw one line of bold labels each followed by plain text."""
+		leading = FONT_SIZE * LINE_HEIGHT
+		self.ensure_space(leading + FONT_SIZE)
+		self.y -= FONT_SIZE * 0.5 + leading
+
+		text = self.canvas.beginText(MARGIN, self.y)
+		text.setFillColor(TEXT_COLOR)
+		for label, value in segments:
+			text.setFont(self.bold_font, FONT_SIZE)
+			text.textOut(_text(label))
+			text.setFont(self.font, FONT_SIZE)
+			text.textOut(_text(value))
+		self.canvas.drawText(text)
+		self.y -= FONT_SIZE * 0.5
+
+	def rule(self):
+		"""Draw a horizontal rule like the hr style."""
+		self.ensure_space(2 * FONT_SIZE)
+		self.y -= FONT_SIZE
+		self.canvas.setStrokeColor(RULE_COLOR)
+		self.canvas.setLineWidth(0.75)
+		self.canvas.line(MARGIN, self.y, MARGIN + CONTENT_WIDTH, self.y)
+		self.y -= FONT_SIZE
+
+	def table(self, rows, header=None, bold_labels=True):
+		"""Draw a bordered two-column table of (label, value) rows."""
+		leading = FONT_SIZE * LINE_HEIGHT
+		value_width = CONTENT_WIDTH - LABEL_COLUMN_WIDTH
+		self.y -= FONT_SIZE * 0.5
+
+		if header:
+			rows = [header] + rows
+		for row_number, (label, value) in enumerate(rows):
+			is_header = header is not None and row_number == 0
+			label_font = self.bold_font if bold_labels or is_header else self.font
+			value_font = self.bold_font if is_header else self.font
+			label_lines = simpleSplit(_text(label), label_font, FONT_SIZE, LABEL_COLUMN_WIDTH - 2 * CELL_PADDING_X)
+			value_lines = simpleSplit(_text(value), value_font, FONT_SIZE, value_width - 2 * CELL_PADDING_X)
+			height = max(len(label_lines), len(value_lines), 1) * leading + 2 * CELL_PADDING_Y
+
+			self.ensure_space(height)
+			self.y -= height
+
+			self.canvas.setStrokeColor(BORDER_COLOR)
+			self.canvas.setFillColor(HEADER_FILL)
+			self.canvas.setLineWidth(0.75)
+			self.canvas.rect(MARGIN, self.y, LABEL_COLUMN_WIDTH, height, fill=int(is_header))
+			self.canvas.rect(MARGIN + LABEL_COLUMN_WIDTH, self.y, value_width, height, fill=int(is_header))
+
+			self.canvas.setFillColor(TEXT_COLOR)
+			for x, font, lines in (
+				(MARGIN, label_font, label_lines),
+				(MARGIN + LABEL_COLUMN_WIDTH, value_font, value_lines),
+			):
+				self.canvas.setFont(font, FONT_SIZE)
+				baseline = self.y + height - CELL_PADDING_Y - FONT_SIZE
+				for line in lines:
+					self.canvas.drawString(x + CELL_PADDING_X, baseline, line)
+					baseline -= leading
+
+		self.y -= FONT_SIZE * 0.5
+
+
+def _text(value):
+	"""Convert a value to text, with lookalikes the standard PDF fonts can encode."""
+	return str(value).translate(CHARACTER_SUBSTITUTIONS)
+
+
+def _strings(value):
+	"""Yield every string of a record value, including nested ones like the technician."""
+	if isinstance(value, dict):
+		for item in value.values():
+			yield from _strings(item)
+	elif value is not None:
+		yield _text(value)
+
+
+@lru_cache(maxsize=None)
+def unicode_fonts():
+	"""
+	Register the Unicode TrueType fonts, on first use.
+
+	Returns:
+		tuple: ((regular, bold, italic) font names, set of the code points the
+			regular font covers), or None if UNICODE_FONT_FILES[0] is not found
+	"""
+	paths = []
+	for filename in UNICODE_FONT_FILES:
+		found = [
+			os.path.join(directory, filename)
+			for directory in UNICODE_FONT_DIRS
+			if os.path.isfile(os.path.join(directory, filename))
+		]
+		paths.append(found[0] if found else None)
+	if paths[0] is None:
+		return None
+
+	names = []
+	for path in paths:
+		if path is None:
+			names.append(names[0])
+			continue
+		name = os.path.splitext(os.path.basename(path))[0]
+		pdfmetrics.registerFont(TTFont(name, path))
+		names.append(name)
+	covered = set(pdfmetrics.getFont(names[0]).face.charToGlyph)
+	return tuple(names), covered
+
+
+def _fonts_for(data):
+	"""
+	Choose the fonts of a document.
+
+	Returns:
+		tuple: (regular, bold, italic) font names: the standard fonts when they
+			can encode every string of ``data``, otherwise the Unicode fonts
+
+	Raises:
+		ValueError: If the text needs characters no available font can draw
+	"""
+	text = "".join(_strings(dict(data)))
+	try:
+		text.encode("cp1252")
+		return FONT, BOLD_FONT, ITALIC_FONT
+	except UnicodeEncodeError:
+		pass
+
+	fonts = unicode_fonts()
+	if fonts is None:
+		raise ValueError(
+			f"The reportlab engine needs {UNICODE_FONT_FILES[0]} for non-Latin text "
+			"(install DejaVu Sans), or render with the markdown or html engine"
+		)
+	names, covered = fonts
+	missing = sorted({ch for ch in text if ord(ch) not in covered and not ch.isspace()})
+	if missing:
+		shown = "".join(missing[:10])
+		raise ValueError(
+			f"The reportlab engine has no font for the characters '{shown}'; "
+			"render this document with the markdown or html engine"
+		)
+	return names
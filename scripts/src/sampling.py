@@ -0,0 +1,181 @@
+"""Weighted sampling in O(1) per draw with Walker/Vose alias tables."""
+
+import numpy as np
+
+
+# Record dimensions that accept a weight spec
+DIMENSIONS = ("category", "issue", "technician", "company", "client")
+
+
+def zipf_weights(count, exponent):
+	"""
+	Zipf weights for ``count`` options ranked in order: rank r gets 1 / r**exponent.
+
+	Args:
+		count (int): Number of options
+		exponent (float): Skew; 0 is uniform, around 1 is typical of real traffic
+
+	Returns:
+		numpy.ndarray: The weights
+	"""
+	return 1.0 / np.arange(1, count + 1) ** exponent
+
+
+def resolve_weights(spec, options):
+	"""
+	Turn a weight spec into one weight per option.
+
+	Args:
+		spec: ``{"zipf": exponent}`` to skew by position (first option most
+			likely), a list with one weight per option, or a dict mapping
+			option names to weights, where unnamed options get weight 1
+		options (list or int): Option names, or the number of unnamed options
+
+	Returns:
+		list: One weight per option
+
+	Raises:
+		ValueError: If the spec does not fit the options
+	"""
+	count = options if isinstance(options, int) else len(options)
+	if isinstance(spec, dict) and set(spec) == {"zipf"}:
+		return zipf_weights(count, float(spec["zipf"])).tolist()
+	if isinstance(spec, dict):
+		if isinstance(options, int):
+			raise ValueError("Weights by name need named options; use a list or zipf")
+		unknown = set(spec) - set(options)
+		if unknown:
+			raise ValueError(f"Unknown options in weights: {', '.join(sorted(unknown))}")
+		return [float(spec.get(name, 1.0)) for name in options]
+	if len(spec) != count:
+		raise ValueError(f"Expected {count} weights, got {len(spec)}")
+	return [float(weight) for weight in spec]
+
+
+def parse_weight_spec(text):
+	"""
+	Parse a weight spec given on the command line.
+
+	Accepts ``zipf:1.2``, ``1,2,3`` (weights in catalog order) and
+	``Fryers:5,Refrigeration:4`` (weights by name, other options weight 1).
+
+	Returns:
+		dict or list: Spec for ``resolve_weights``
+	"""
+	if text.startswith("zipf:"):
+		return {"zipf": float(text[len("zipf:"):])}
+	items = [item.strip() for item in text.split(",") if item.strip()]
+	if all(":" not in item for item in items):
+		return [float(item) for item in items]
+	spec = {}
+	for item in items:
+		name, _, weight = item.rpartition(":")
+		spec[name.strip()] = float(weight)
+	return spec
+
+
+def _build_alias(weights):
+	"""
+	Build the probability and alias columns of an alias table (Vose's method).
+
+	Returns:
+		tuple: (prob, alias) lists of the same length as ``weights``
+	"""
+	weights = np.asarray(weights, dtype=float)
+	if weights.ndim != 1 or not len(weights) or (weights < 0).any() or weights.sum() <= 0:
+		raise ValueError("Weights must be a non-empty list of non-negative numbers with a positive sum")
+
+	count = len(weights)
+	scaled = (weights * count / weights.sum()).tolist()
+	prob = [1.0] * count
+	alias = list(range(count))
+	small = [i for i, p in enumerate(scaled) if p < 1.0]
+	large = [i for i, p in enumerate(scaled) if p >= 1.0]
+	while small and large:
+		s, l = small.pop(), large.pop()
+		prob[s] = scaled[s]
+		alias[s] = l
+		scaled[l] -= 1.0 - scaled[s]
+		(small if scaled[l] < 1.0 else large).append(l)
+	# Whatever is left is 1 up to rounding
+	return prob, alias
+
+
+class AliasTable:
+	"""Draw option indexes with the given weights in constant time."""
+
+	def __init__(self, weights):
+		"""
+		Build the table.
+
+		Args:
+			weights (list): Non-negative weight per option, not necessarily normalized
+		"""
+		self.prob, self.alias = _build_alias(weights)
+		self.size = len(self.prob)
+		self._prob = np.array(self.prob)
+		self._alias = np.array(self.alias)
+
+	def draw(self, rnd):
+		"""
+		Draw one index.
+
+		Args:
+			rnd (random.Random): Random stream
+
+		Returns:
+			int: Option index
+		"""
+		i = int(rnd.random() * self.size)
+		return i if rnd.random() < self.prob[i] else self.alias[i]
+
+	def sample(self, rng, n):
+		"""
+		Draw ``n`` indexes at once.
+
+		Args:
+			rng (numpy.random.Generator): Random stream
+			n (int): Number of draws
+
+		Returns:
+			numpy.ndarray: Option indexes
+		"""
+		i = rng.integers(0, self.size, n)
+		return np.where(rng.random(n) < self._prob[i], i, self._alias[i])
+
+
+class GroupedAliasTable:
+	"""Alias tables for several groups of options, e.g. the issues of each category."""
+
+	def __init__(self, group_weights):
+		"""
+		Build one table per group.
+
+		Args:
+			group_weights (list): Weight list per group
+		"""
+		self.tables = [AliasTable(weights) for weights in group_weights]
+		self._counts = np.array([table.size for table in self.tables])
+		self._offsets = np.concatenate(([0], np.cumsum(self._counts)[:-1]))
+		self._prob = np.concatenate([table._prob for table in self.tables])
+		self._alias = np.concatenate([table._alias for table in self.tables])
+
+	def draw(self, rnd, group):
+		"""Draw one index within ``group``."""
+		return self.tables[group].draw(rnd)
+
+	def sample(self, rng, groups):
+		"""
+		Draw one index within each of ``groups``.
+
+		Args:
+			rng (numpy.random.Generator): Random stream
+			groups (numpy.ndarray): Group of each draw
+
+		Returns:
+			numpy.ndarray: Option index within its group, per draw
+		"""
+		n = len(groups)
+		i = (rng.random(n) * self._counts[groups]).astype(np.int64)
+		flat = self._offsets[groups] + i
+		return np.where(rng.random(n) < self._prob[flat], i, self._alias[flat])
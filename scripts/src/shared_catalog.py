@@ -0,0 +1,229 @@
+"""The catalog records refer to, in a read-only shared-memory block for worker processes."""
+
+from collections.abc import Sequence
+from multiprocessing import shared_memory
+import numpy as np
+from .records import CLIENT_FIELDS, RecordBatch, catalog_tables, decode_record, encode_record
+
+
+# Fields of a record spec, in order: the RecordBatch columns of one record
+SPEC_FIELDS = (*RecordBatch.DTYPES, *CLIENT_FIELDS)
+
+# Technician fields, in the order they are stored
+TECHNICIAN_FIELDS = ("name", "id", "cert")
+
+# Header entries: string counts per section and the size of the string data
+_HEADER = ("categories", "models", "issues", "parts", "technicians", "companies", "text_size")
+
+
+def record_spec(record, tables=None):
+	"""
+	Encode a record into a spec: catalog codes and its client strings.
+
+	Args:
+		record (Mapping): Record dict or ServiceRecord with the catalog's own
+			problem and solution texts
+		tables (dict, optional): Catalog tables. Defaults to ``catalog_tables()``.
+
+	Returns:
+		tuple: One value per SPEC_FIELDS entry
+
+	Raises:
+		ValueError: If the record refers to values that are not in the catalog
+	"""
+	row = encode_record(record, tables)
+	return tuple(row[name] for name in SPEC_FIELDS)
+
+
+class _Table(Sequence):
+	"""A read-only sequence whose items are built on access."""
+
+	def __init__(self, size, item):
+		self._size = size
+		self._item = item
+
+	def __len__(self):
+		return self._size
+
+	def __getitem__(self, index):
+		if not -self._size <= index < self._size:
+			raise IndexError(index)
+		return self._item(index % self._size)
+
+
+def _aligned(size):
+	"""Round a byte size up to a multiple of 8."""
+	return (size + 7) & ~7
+
+
+class SharedCatalog:
+	"""
+	Category, model, issue, part, technician and company strings in one
+	shared-memory block.
+
+	The parent process encodes the catalog once with ``create``. Worker
+	processes ``attach`` to the block by name: the catalog is neither pickled
+	into their tasks nor loaded again, and its pages stay shared however many
+	workers read them, since no Python object refers to them. Tasks then only
+	carry record specs (see ``record_spec``), which ``record`` resolves.
+
+	The block holds a header of section sizes, the end offset of every string,
+	the first model of each category, the first part of each issue, and the
+	UTF-8 text of all strings. Strings are decoded when they are read.
+	"""
+
+	def __init__(self, memory, owner=False):
+		"""
+		Wrap a shared-memory block written by ``create``.
+
+		Args:
+			memory (SharedMemory): The block
+			owner (bool): Whether closing the catalog also frees the block
+		"""
+		self._memory = memory
+		self._owner = owner
+		buffer = memory.buf.toreadonly()
+		counts = dict(zip(_HEADER, buffer[:8 * len(_HEADER)].cast("q")))
+		strings = (
+			counts["categories"]
+			+ counts["models"]
+			+ 2 * counts["issues"]
+			+ counts["parts"]
+			+ len(TECHNICIAN_FIELDS) * counts["technicians"]
+			+ counts["companies"]
+		)
+		position = _aligned(8 * len(_HEADER))
+		# Memoryviews rather than arrays: indexing them gives plain ints
+		arrays = {}
+		for name, format, size in (
+			("ends", "q", strings + 1),
+			("model_offsets", "i", counts["categories"] + 1),
+			("part_offsets", "i", counts["issues"] + 1),
+		):
+			arrays[name] = buffer[position:].cast(format)[:size]
+			position = _aligned(position + arrays[name].nbytes)
+		self._ends = arrays["ends"]
+		self._text = buffer[position:position + counts["text_size"]]
+
+		# First string of each section; categories come first
+		models = counts["categories"]
+		problems = models + counts["models"]
+		solutions = problems + counts["issues"]
+		parts = solutions + counts["issues"]
+		technicians = parts + counts["parts"]
+		companies = technicians + len(TECHNICIAN_FIELDS) * counts["technicians"]
+
+		model_offsets = arrays["model_offsets"]
+		part_offsets = arrays["part_offsets"]
+		self.tables = {
+			"categories": _Table(counts["categories"], self.string),
+			"models": _Table(counts["categories"], lambda c: self._strings(
+				models + model_offsets[c], models + model_offsets[c + 1]
+			)),
+			"issues": _Table(counts["issues"], lambda i: {
+				"problem": self.string(problems + i),
+				"solution": self.string(solutions + i),
+				"parts": self._strings(parts + part_offsets[i], parts + part_offsets[i + 1]),
+			}),
+			"technicians": _Table(counts["technicians"], lambda t: {
+				field: self.string(technicians + len(TECHNICIAN_FIELDS) * t + f)
+				for f, field in enumerate(TECHNICIAN_FIELDS)
+			}),
+			"companies": _Table(counts["companies"], lambda c: self.string(companies + c)),
+		}
+
+	@classmethod
+	def create(cls, tables=None):
+		"""
+		Encode the catalog into a new shared-memory block.
+
+		Args:
+			tables (dict, optional): Catalog tables. Defaults to ``catalog_tables()``.
+
+		Returns:
+			SharedCatalog: The catalog, owning the block until ``close``
+		"""
+		tables = tables or catalog_tables()
+		issues = tables["issues"]
+		strings = [
+			*tables["categories"],
+			*(model for models in tables["models"] for model in models),
+			*(issue["problem"] for issue in issues),
+			*(issue["solution"] for issue in issues),
+			*(part for issue in issues for part in issue["parts"]),
+			*(technician[field] for technician in tables["technicians"] for field in TECHNICIAN_FIELDS),
+			*tables["companies"],
+		]
+		encoded = [string.encode() for string in strings]
+		header = np.array([
+			len(tables["categories"]),
+			sum(len(models) for models in tables["models"]),
+			len(issues),
+			sum(len(issue["parts"]) for issue in issues),
+			len(tables["technicians"]),
+			len(tables["companies"]),
+			sum(len(data) for data in encoded),
+		], dtype=np.int64)
+		sections = [
+			header,
+			np.cumsum([0] + [len(data) for data in encoded], dtype=np.int64),
+			np.cumsum([0] + [len(models) for models in tables["models"]], dtype=np.int32),
+			np.cumsum([0] + [len(issue["parts"]) for issue in issues], dtype=np.int32),
+			np.frombuffer(b"".join(encoded), dtype=np.uint8),
+		]
+
+		memory = shared_memory.SharedMemory(
+			create=True, size=max(1, sum(_aligned(section.nbytes) for section in sections))
+		)
+		position = 0
+		for section in sections:
+			memory.buf[position:position + section.nbytes] = section.tobytes()
+			position = _aligned(position + section.nbytes)
+		return cls(memory, owner=True)
+
+	@classmethod
+	def attach(cls, name):
+		"""
+		Attach to a catalog created by another process.
+
+		Args:
+			name (str): ``name`` of the creating process's catalog
+
+		Returns:
+			SharedCatalog: The catalog
+		"""
+		return cls(shared_memory.SharedMemory(name=name))
+
+	@property
+	def name(self):
+		"""Name of the shared-memory block, for ``attach``."""
+		return self._memory.name
+
+	def string(self, k):
+		"""Decode string ``k`` of the block."""
+		return str(self._text[self._ends[k]:self._ends[k + 1]], "utf-8")
+
+	def _strings(self, start, stop):
+		"""Strings ``start`` to ``stop`` of the block, as a sequence."""
+		return _Table(stop - start, lambda k: self.string(start + k))
+
+	def record(self, spec):
+		"""
+		Resolve a record spec.
+
+		Args:
+			spec (tuple): Spec from ``record_spec``
+
+		Returns:
+			ServiceRecord: The record
+		"""
+		return decode_record(dict(zip(SPEC_FIELDS, spec)), self.tables)
+
+	def close(self):
+		"""Detach from the block, and free it if this catalog created it."""
+		# Views into the block must be released before it can be closed
+		self.tables = None
+		self._ends = self._text = None
+		self._memory.close()
+		if self._owner:
+			self._memory.unlink()
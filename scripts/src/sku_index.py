@@ -0,0 +1,110 @@
+"""Sorted index of the catalog's parts for exact and prefix SKU lookups."""
+
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from .issue_store import ISSUES_FILE, catalog_revision, service_issues
+
+
+def part_sku(part):
+	"""
+	Return the SKU of a part string.
+
+	Args:
+		part (str): Part as listed in an issue, e.g.
+			"SKU-TC-001834 - Thermocouple Type K 18-inch"
+
+	Returns:
+		str or None: The SKU ("SKU-TC-001834"), or None for parts without one
+	"""
+	if part[:4].lower() != "sku-":
+		return None
+	return part.split(" - ", 1)[0].strip()
+
+
+class SkuIndex:
+	"""
+	Every part of the catalog, sorted by its lowercased text.
+
+	A part string starts with its SKU, so the parts whose SKU starts with a
+	prefix are one contiguous run of the sorted keys, found by binary search
+	in O(log n). Parts used by several issues appear once per issue.
+	"""
+
+	def __init__(self, issues):
+		"""
+		Build the index.
+
+		Args:
+			issues (dict): Machine category -> list of issues, as returned by
+				``issue_store.service_issues``
+		"""
+		rows = sorted(
+			(part.lower(), category, i, part)
+			for category, category_issues in issues.items()
+			for i, issue in enumerate(category_issues)
+			for part in issue["parts"]
+		)
+		self.keys = [key for key, _, _, _ in rows]
+		self.matches = [
+			(category, issues[category][i], part) for _, category, i, part in rows
+		]
+
+	def __len__(self):
+		return len(self.keys)
+
+	def prefix(self, text):
+		"""
+		Find the parts starting with ``text``, ignoring case.
+
+		Args:
+			text (str): SKU prefix, e.g. "SKU-TC" or "sku-tc-0018"
+
+		Returns:
+			list: (category, issue, part) tuples, sorted by part
+		"""
+		text = text.lower()
+		start = bisect_left(self.keys, text)
+		stop = bisect_left(self.keys, text + "\U0010ffff", start)
+		return self.matches[start:stop]
+
+	def exact(self, sku):
+		"""
+		Find the parts with SKU ``sku``, ignoring case.
+
+		Args:
+			sku (str): Complete SKU, e.g. "SKU-TC-001834"
+
+		Returns:
+			list: (category, issue, part) tuples, one per issue using the part
+		"""
+		sku = sku.lower()
+		# Parts that are a bare SKU, then parts listed as "SKU - name"
+		start, stop = bisect_left(self.keys, sku), bisect_right(self.keys, sku)
+		return self.matches[start:stop] + self.prefix(sku + " - ")
+
+	def skus(self):
+		"""
+		List every part that has a SKU.
+
+		Returns:
+			list: (sku, category, part) tuples, sorted by SKU
+		"""
+		return [(part_sku(part), category, part) for category, _, part in self.prefix("sku-")]
+
+
+@lru_cache(maxsize=1)
+def _index(path, revision):
+	return SkuIndex(service_issues(path))
+
+
+def sku_index(path=ISSUES_FILE):
+	"""
+	Return the SKU index of the catalog, built once per catalog revision.
+
+	Args:
+		path (str): Issue file
+
+	Returns:
+		SkuIndex: The index
+	"""
+	return _index(path, catalog_revision(path))
@@ -0,0 +1,327 @@
+"""Word-level Markov model of problem descriptions, trained on generated_data."""
+
+import glob
+import hashlib
+import io
+import json
+import os
+import random
+import re
+import tempfile
+from bisect import bisect_right
+from collections import Counter
+import numpy as np
+from .constants import MACHINE_CATEGORIES
+from .ids import _mix
+from .records import catalog_tables
+
+
+MODEL_VERSION = 1
+
+# Reserved token ids marking the start and end of a text
+_START = 0
+_END = 1
+
+# Arrays stored per category, in _Chain argument order
+_ARRAYS = ("contexts", "offsets", "words", "counts", "states", "seen")
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def _text_hash(text):
+	"""Stable 64-bit hash of a text, for telling generated texts from training texts."""
+	return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+
+
+def _join(strings):
+	"""Pack strings into a uint8 array, one per line."""
+	return np.frombuffer("\n".join(strings).encode(), dtype=np.uint8)
+
+
+def _split(array):
+	"""Unpack strings packed by ``_join``."""
+	return bytes(array).decode().split("\n")
+
+
+def read_training_texts(data_dir):
+	"""
+	Collect problem descriptions from generate_service_data.py output.
+
+	Reads every ``*.json`` file in ``data_dir``: per-category files
+	(``fryers.json``, a list of issues) and the combined ``all_issues.json``
+	(issue lists by category). Texts found in several files count once.
+
+	Args:
+		data_dir (str): Directory of JSON files
+
+	Returns:
+		dict: Category -> list of problem texts
+	"""
+	categories = {category.lower(): category for category in MACHINE_CATEGORIES}
+	texts = {}
+	for path in sorted(glob.glob(os.path.join(data_dir, "*.json"))):
+		with open(path) as f:
+			data = json.load(f)
+		if isinstance(data, list):
+			stem = os.path.splitext(os.path.basename(path))[0].lower()
+			data = {categories[stem]: data} if stem in categories else {}
+		for category, issues in data.items():
+			for issue in issues:
+				texts.setdefault(category, {})[issue["problem"].strip()] = None
+	return {category: list(problems) for category, problems in texts.items()}
+
+
+class _Chain:
+	"""
+	The transitions of one category, in compressed sparse row form.
+
+	State ``s`` is a context of ``order`` token ids. Its successors are
+	``words[offsets[s]:offsets[s + 1]]`` with cumulative counts in ``totals``,
+	and ``states`` holds the state each successor leads to, so generation
+	never hashes a context.
+	"""
+
+	def __init__(self, contexts, offsets, words, counts, states, seen):
+		self.contexts = contexts
+		self.offsets = offsets.tolist()
+		self.words = words.tolist()
+		self.counts = counts
+		self.states = states.tolist()
+		self.seen = seen
+		totals = np.cumsum(counts, dtype=np.int64)
+		# Restart the running totals at every state
+		totals -= np.repeat(np.concatenate(([0], totals[offsets[1:-1] - 1])), np.diff(offsets))
+		self.totals = totals.tolist()
+		self.state_of = {tuple(context): s for s, context in enumerate(contexts.tolist())}
+		self.seen_set = set(seen.tolist())
+
+	@classmethod
+	def train(cls, texts, vocab, order):
+		"""Count the transitions of ``texts``, adding new words to ``vocab``."""
+		transitions = Counter()
+		for text in texts:
+			tokens = [_START] * order
+			tokens += [vocab.setdefault(word, len(vocab)) for word in text.split()]
+			tokens.append(_END)
+			for i in range(order, len(tokens)):
+				transitions[tuple(tokens[i - order:i]), tokens[i]] += 1
+
+		contexts = sorted({context for context, _ in transitions})
+		state_of = {context: s for s, context in enumerate(contexts)}
+		rows = sorted(transitions.items(), key=lambda item: (state_of[item[0][0]], item[0][1]))
+		offsets = np.searchsorted(
+			[state_of[context] for (context, _), _ in rows], np.arange(len(contexts) + 1)
+		)
+		return cls(
+			np.array(contexts, dtype=np.int32).reshape(len(contexts), order),
+			offsets.astype(np.int32),
+			np.array([word for (_, word), _ in rows], dtype=np.int32),
+			np.array([count for _, count in rows], dtype=np.uint32),
+			np.array(
+				[-1 if word == _END else state_of[context[1:] + (word,)] for (context, word), _ in rows],
+				dtype=np.int32,
+			),
+			np.array(sorted({_text_hash(text) for text in texts}), dtype=np.uint64),
+		)
+
+	def arrays(self):
+		"""The arrays stored on disk."""
+		return {
+			"contexts": self.contexts,
+			"offsets": np.array(self.offsets, dtype=np.int32),
+			"words": np.array(self.words, dtype=np.int32),
+			"counts": self.counts,
+			"states": np.array(self.states, dtype=np.int32),
+			"seen": self.seen,
+		}
+
+	def walk(self, state, rnd, max_words):
+		"""Generate token ids from ``state`` until the end of the text."""
+		offsets, words, totals, states = self.offsets, self.words, self.totals, self.states
+		tokens = []
+		while len(tokens) < max_words:
+			start, stop = offsets[state], offsets[state + 1]
+			k = bisect_right(totals, rnd.random() * totals[stop - 1], start, stop)
+			if words[k] == _END:
+				break
+			tokens.append(words[k])
+			state = states[k]
+		return tokens
+
+
+class MarkovTextModel:
+	"""
+	Generate problem descriptions with a word-level Markov chain per category.
+
+	Trained on the issues ``generate_service_data.py`` writes to
+	``generated_data/``, so fresh problem text needs no API calls. The model is
+	a little over 100 KB on disk: a shared vocabulary and, per category, the
+	transitions between contexts of ``order`` words in compressed sparse row
+	form. Texts identical to a training text are drawn again.
+
+	As a text source for ServiceDocumentDataGenerator, ``texts(issue, variant)``
+	keeps the issue's first sentence, its symptom, and continues it with the
+	chain of its category, so the text stays consistent with the issue's
+	solution and parts.
+	"""
+
+	def __init__(self, vocab, chains, order, seed=None, attempts=10, max_words=120):
+		"""
+		Initialize the model.
+
+		Args:
+			vocab (list): Word of each token id
+			chains (dict): Category -> _Chain
+			order (int): Number of words of context
+			seed (int, optional): Seed of ``texts``. A random one is chosen if None.
+			attempts (int): Draws before accepting a text identical to a training text
+			max_words (int): Longest text generated
+		"""
+		self.vocab = vocab
+		self.chains = chains
+		self.order = order
+		self.seed = seed if seed is not None else np.random.SeedSequence().entropy
+		self.attempts = attempts
+		self.max_words = max_words
+		self._key = _mix(self.seed, MODEL_VERSION)
+
+		tables = catalog_tables()
+		self._ids = {word: i for i, word in enumerate(vocab)}
+		self._issue_categories = [
+			category
+			for category, count in zip(tables["categories"], tables["issue_counts"])
+			for _ in range(count)
+		]
+
+	@classmethod
+	def train(cls, data_dir="generated_data", order=2, **options):
+		"""
+		Train a model on the JSON files of ``data_dir``.
+
+		Args:
+			data_dir (str): Directory of generate_service_data.py output
+			order (int): Number of words of context; higher is more fluent but
+				closer to the training texts
+			**options: Further MarkovTextModel arguments
+
+		Returns:
+			MarkovTextModel: The trained model
+		"""
+		vocab = {"<s>": _START, "</s>": _END}
+		chains = {
+			category: _Chain.train(texts, vocab, order)
+			for category, texts in read_training_texts(data_dir).items()
+		}
+		if not chains:
+			raise ValueError(f"No training texts found in {data_dir}")
+		return cls(list(vocab), chains, order, **options)
+
+	@classmethod
+	def load(cls, path, **options):
+		"""
+		Load a model saved by ``save``.
+
+		Args:
+			path (str): Model file
+			**options: Further MarkovTextModel arguments
+
+		Returns:
+			MarkovTextModel: The model
+
+		Raises:
+			ValueError: If the file was written by an incompatible version
+		"""
+		with np.load(path) as data:
+			if int(data["version"]) != MODEL_VERSION:
+				raise ValueError(f"{path} is a version {int(data['version'])} model, expected {MODEL_VERSION}")
+			chains = {
+				category: _Chain(*(data[f"{c}.{name}"] for name in _ARRAYS))
+				for c, category in enumerate(_split(data["categories"]))
+			}
+			return cls(_split(data["vocab"]), chains, int(data["order"]), **options)
+
+	def save(self, path):
+		"""Write the model to ``path``, compressed, replacing it atomically."""
+		arrays = {
+			"version": np.array(MODEL_VERSION),
+			"order": np.array(self.order),
+			"vocab": _join(self.vocab),
+			"categories": _join(self.chains),
+		}
+		for c, chain in enumerate(self.chains.values()):
+			arrays.update({f"{c}.{name}": array for name, array in chain.arrays().items()})
+		directory = os.path.dirname(path) or "."
+		os.makedirs(directory, exist_ok=True)
+		buffer = io.BytesIO()
+		np.savez_compressed(buffer, **arrays)
+		fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+		with os.fdopen(fd, "wb") as f:
+			f.write(buffer.getvalue())
+		os.replace(tmp_path, path)
+
+	def generate(self, category, rnd, prefix=None):
+		"""
+		Generate one problem description.
+
+		Args:
+			category (str): Machine category
+			rnd (random.Random): Random stream
+			prefix (str, optional): Opening of the text to continue. If the
+				model never saw its last words, a new text is generated and its
+				first sentence replaced by the prefix.
+
+		Returns:
+			str: The text
+		"""
+		chain = self.chains[category]
+		words = prefix.split() if prefix else []
+		context = ([_START] * self.order + [self._ids.get(word, -1) for word in words])[-self.order:]
+		state = chain.state_of.get(tuple(context))
+		text = None
+		for _ in range(self.attempts):
+			if state is not None:
+				tokens = chain.walk(state, rnd, self.max_words)
+				text = " ".join(words + [self.vocab[t] for t in tokens])
+			else:
+				text = " ".join(self.vocab[t] for t in chain.walk(0, rnd, self.max_words))
+				text = " ".join([prefix, *_SENTENCE_END.split(text, 1)[1:]])
+			if _text_hash(text) not in chain.seen_set:
+				break
+		return text
+
+	def iter_problems(self, category, count=None, seed=None):
+		"""
+		Stream new problem descriptions of a category.
+
+		Args:
+			category (str): Machine category
+			count (int, optional): Number of texts. Unbounded if None.
+			seed (int, optional): Random seed
+
+		Yields:
+			str: Problem description
+		"""
+		rnd = random.Random(seed)
+		generated = 0
+		while count is None or generated < count:
+			yield self.generate(category, rnd)
+			generated += 1
+
+	def texts(self, issue, variant):
+		"""
+		Text source interface of ServiceDocumentDataGenerator.
+
+		Args:
+			issue (int): Catalog issue code (see ``records.catalog_tables``)
+			variant (int): Number of the text, e.g. the record index
+
+		Returns:
+			tuple: (problem, solution); the solution is the catalog's
+		"""
+		issue_data = catalog_tables()["issues"][issue]
+		category = self._issue_categories[issue]
+		if category not in self.chains:
+			return issue_data["problem"], issue_data["solution"]
+		rnd = random.Random(_mix(_mix(issue, self._key) ^ variant, self._key))
+		symptom = _SENTENCE_END.split(issue_data["problem"].strip(), 1)[0]
+		return self.generate(category, rnd, prefix=symptom), issue_data["solution"]
@@ -0,0 +1,342 @@
+"""Offline variations of the SERVICE_ISSUES problem and solution texts."""
+
+import math
+import random
+import re
+import numpy as np
+from .ids import KeyedPermutation, _mix
+from .records import catalog_tables
+
+
+# Interchangeable words and phrases. Any member found in an issue text can be
+# replaced by any member of its group; matching ignores case and keeps the
+# capitalization of the original.
+PROBLEM_SYNONYMS = [
+	("won't", "will not", "refuses to"),
+	("can't", "cannot"),
+	("doesn't", "does not"),
+	("isn't", "is not"),
+	("don't", "do not"),
+	("there's", "there is"),
+	("completely", "totally", "entirely"),
+	("constantly", "continuously", "nonstop"),
+	("sometimes", "at times", "every so often"),
+	("randomly", "at random", "out of nowhere"),
+	("yesterday", "the other day"),
+	("customers", "guests", "diners"),
+	("kitchen staff", "kitchen team", "kitchen crew"),
+	("staff", "team", "crew"),
+	("really", "seriously"),
+	("worried", "concerned", "nervous"),
+	("afraid", "scared"),
+	("dangerous", "unsafe", "hazardous"),
+	("frustrated", "fed up", "annoyed"),
+	("anymore", "any longer"),
+	("forever", "ages"),
+	("lunch rush", "lunch service"),
+	("dinner rush", "dinner service"),
+	("weird", "strange", "odd"),
+	("properly", "correctly"),
+	("barely", "hardly"),
+	("every day", "daily"),
+	("immediately", "right away"),
+	("the whole", "the entire"),
+	("problem", "issue"),
+	("problems", "issues"),
+	("terrible", "awful", "horrible"),
+	("nasty", "gross"),
+]
+
+SOLUTION_SYNONYMS = [
+	("replaced the", "swapped out the", "changed out the"),
+	("faulty", "defective", "malfunctioning"),
+	("damaged", "deteriorated", "compromised"),
+	("cleaned", "thoroughly cleaned"),
+	("installed", "fitted"),
+	("proper", "correct"),
+	("ensure", "guarantee"),
+	("new", "brand-new"),
+	("adjusted", "readjusted"),
+	("repaired", "fixed"),
+	("clogged", "blocked", "obstructed"),
+]
+
+# Sentences that fit any issue, mixed into problem descriptions and solutions
+PROBLEM_OPENERS = [
+	"Hi there.",
+	"Hoping someone can help.",
+	"Not sure who else to call.",
+	"We need a technician out here.",
+	"Following up on our call this morning.",
+	"Good morning.",
+	"Calling in a repair request.",
+	"We have a problem in the kitchen.",
+]
+PROBLEM_IMPACTS = [
+	"We've already thrown out a lot of product because of this.",
+	"We're running the line short-handed while it's down.",
+	"It's been getting worse every day.",
+	"We tried turning it off and on again, but that didn't help.",
+	"This is the second time this month it has happened.",
+	"My manager wants it fixed before our next health inspection.",
+	"We've had to take items off the menu until it's fixed.",
+	"Weekends are our busiest time, so this can't wait.",
+]
+PROBLEM_CLOSERS = [
+	"Please send someone as soon as possible.",
+	"Can you get a technician out this week?",
+	"We need this fixed before the weekend.",
+	"Please call me back to schedule a visit.",
+	"This is really urgent for us.",
+	"Thanks in advance.",
+	"Any time tomorrow morning works for us.",
+	"Let me know what it will cost.",
+]
+SOLUTION_PREFIXES = [
+	"Diagnosed on site.",
+	"Inspected the unit and confirmed the reported fault.",
+	"Ran diagnostics and traced the fault.",
+]
+SOLUTION_SUFFIXES = [
+	"Tested the unit through a full cycle and confirmed normal operation.",
+	"Verified operation with the kitchen manager before leaving.",
+	"Advised staff on daily cleaning to prevent a repeat.",
+	"Checked the remaining components; no further issues found.",
+]
+
+# Largest number of combinations enumerated per issue
+_MAX_COMBINATIONS = 1 << 62
+
+# Mixed into the seed for the typo stream
+_TYPO_STREAM = 0x7E57
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def _compile_synonyms(groups):
+	"""Build one regex matching every member of ``groups``, longest first."""
+	members = {member.lower(): g for g, group in enumerate(groups) for member in group}
+	pattern = "|".join(re.escape(m) for m in sorted(members, key=len, reverse=True))
+	return re.compile(rf"\b(?:{pattern})\b", re.IGNORECASE), members
+
+
+def _compile_text(text, pattern, members):
+	"""
+	Split a text into literal strings and synonym slots.
+
+	Returns:
+		tuple: Literal strings and (group, capitalized) slots, in order
+	"""
+	parts = []
+	position = 0
+	for match in pattern.finditer(text):
+		parts.append(text[position:match.start()])
+		parts.append((members[match.group().lower()], match.group()[0].isupper()))
+		position = match.end()
+	parts.append(text[position:])
+	return tuple(part for part in parts if part != "")
+
+
+def _digits(number, radixes):
+	"""Split ``number`` into mixed-radix digits, least significant first."""
+	digits = []
+	for radix in radixes:
+		number, digit = divmod(number, radix)
+		digits.append(digit)
+	return digits
+
+
+def _order(count, k):
+	"""
+	Return order ``k`` of ``count`` sentences, in lexicographic order.
+
+	Decodes ``k`` in the factorial number system (its Lehmer code), so no
+	list of all ``count!`` orders is built.
+	"""
+	remaining = list(range(count))
+	order = []
+	for i in range(count - 1, -1, -1):
+		digit, k = divmod(k, math.factorial(i))
+		order.append(remaining.pop(digit))
+	return order
+
+
+def _slots(parts):
+	"""Return the synonym group of every slot of a compiled text."""
+	return [part[0] for part in parts if part.__class__ is not str]
+
+
+class IssueVariator:
+	"""
+	Expand every catalog issue into many distinct phrasings of the same fault.
+
+	A variation keeps the issue's first sentence, its symptom, in front and
+	reorders the remaining sentences. It can add an opener, a generic impact
+	sentence and a closer, swaps words and phrases for synonyms, and adds the
+	occasional typo to the problem. Solutions get synonyms and an optional
+	diagnosis or test sentence. Part lists are untouched, so a variation stays
+	consistent with the parts of its issue.
+
+	Each of these choices is a digit of a mixed-radix number, so an issue has
+	as many variations as the product of its choice counts (thousands to
+	billions). Variant ``v`` of an issue is the combination at position ``v``
+	of a seeded permutation of them, so distinct variants below that count
+	never repeat a problem text, and consecutive variants look unrelated.
+	It only depends on the seed, the issue and ``v``, so a record can use its
+	own index as the variant.
+	"""
+
+	def __init__(self, seed=None, typo_rate=0.01):
+		"""
+		Initialize the variator.
+
+		Args:
+			seed (int, optional): Seed of the variations. A random one is chosen if None.
+			typo_rate (float): Probability that a word of a problem description
+				gets a typo
+		"""
+		self.seed = seed if seed is not None else np.random.SeedSequence().entropy
+		self.typo_rate = typo_rate
+		seed = self.seed
+
+		problem_pattern, problem_members = _compile_synonyms(PROBLEM_SYNONYMS)
+		solution_pattern, solution_members = _compile_synonyms(SOLUTION_SYNONYMS)
+		self._problems = []
+		self._solutions = []
+		self._radixes = []
+		self._permutations = []
+		self._typo_key = _mix(seed, _TYPO_STREAM)
+		for i, issue in enumerate(catalog_tables()["issues"]):
+			sentences = [
+				_compile_text(sentence, problem_pattern, problem_members)
+				for sentence in _SENTENCE_END.split(issue["problem"].strip())
+			]
+			solution = _compile_text(issue["solution"], solution_pattern, solution_members)
+			details = len(sentences) - 1
+			# Choice counts of the problem and the solution, in the order
+			# texts() consumes them
+			radixes = (
+				[
+					math.factorial(details),
+					len(PROBLEM_OPENERS) + 1,
+					len(PROBLEM_IMPACTS) * (details + 1) + 1,
+					len(PROBLEM_CLOSERS) + 1,
+					*(len(PROBLEM_SYNONYMS[g]) for parts in sentences for g in _slots(parts)),
+				],
+				[
+					len(SOLUTION_PREFIXES) + 1,
+					len(SOLUTION_SUFFIXES) + 1,
+					*(len(SOLUTION_SYNONYMS[g]) for g in _slots(solution)),
+				],
+			)
+			self._problems.append(sentences)
+			self._solutions.append(solution)
+			self._radixes.append(radixes)
+			self._permutations.append(tuple(
+				KeyedPermutation(min(math.prod(r), _MAX_COMBINATIONS), seed, stream=2 * i + text)
+				for text, r in enumerate(radixes)
+			))
+
+	def combinations(self, issue):
+		"""Number of distinct problem texts of an issue, before typos."""
+		return self._permutations[issue][0].size
+
+	def texts(self, issue, variant):
+		"""
+		Vary the problem and solution of an issue.
+
+		Args:
+			issue (int): Catalog issue code (see ``records.catalog_tables``)
+			variant (int): Number of the variation, any non-negative integer.
+				Variants past ``combinations(issue)`` wrap around and only
+				differ in their typos.
+
+		Returns:
+			tuple: (problem, solution) texts
+		"""
+		digits = iter([
+			digit
+			for permutation, radixes in zip(self._permutations[issue], self._radixes[issue])
+			for digit in _digits(permutation(variant % permutation.size), radixes)
+		])
+
+		symptom, *details = self._problems[issue]
+		order = _order(len(details), next(digits))
+		opener, impact, closer = next(digits), next(digits), next(digits)
+		sentences = [self._fill(symptom, PROBLEM_SYNONYMS, digits)]
+		sentences += [self._fill(sentence, PROBLEM_SYNONYMS, digits) for sentence in details]
+		sentences[1:] = [sentences[1 + i] for i in order]
+		if impact:
+			position, which = divmod(impact - 1, len(PROBLEM_IMPACTS))
+			sentences.insert(1 + position, PROBLEM_IMPACTS[which])
+		if opener:
+			sentences.insert(0, PROBLEM_OPENERS[opener - 1])
+		if closer:
+			sentences.append(PROBLEM_CLOSERS[closer - 1])
+		problem = " ".join(sentences)
+		if self.typo_rate:
+			rnd = random.Random(_mix(_mix(issue, self._typo_key) ^ variant, self._typo_key))
+			problem = self._add_typos(problem, rnd)
+
+		prefix, suffix = next(digits), next(digits)
+		solution = [self._fill(self._solutions[issue], SOLUTION_SYNONYMS, digits)]
+		if prefix:
+			solution.insert(0, SOLUTION_PREFIXES[prefix - 1])
+		if suffix:
+			solution.append(SOLUTION_SUFFIXES[suffix - 1])
+		return problem, " ".join(solution)
+
+	def iter_texts(self, category, count, start=0):
+		"""
+		Generate variations of every issue of a category in turn.
+
+		Args:
+			category (str): Machine category
+			count (int): Number of variations
+			start (int): Position of the first variation
+
+		Yields:
+			tuple: (issue code, problem, solution)
+		"""
+		tables = catalog_tables()
+		c = tables["category_codes"][category]
+		offset, issues = int(tables["issue_offsets"][c]), int(tables["issue_counts"][c])
+		for position in range(start, start + count):
+			variant, issue = divmod(position, issues)
+			yield (offset + issue, *self.texts(offset + issue, variant))
+
+	@staticmethod
+	def _fill(parts, groups, digits):
+		"""Join a compiled text, taking each slot's synonym from ``digits``."""
+		words = []
+		for part in parts:
+			if part.__class__ is str:
+				words.append(part)
+			else:
+				group, capitalized = part
+				word = groups[group][next(digits)]
+				words.append(word[0].upper() + word[1:] if capitalized else word)
+		return "".join(words)
+
+	def _add_typos(self, text, rnd):
+		"""Misspell each word with probability ``typo_rate``, skipping short words and numbers."""
+		words = text.split(" ")
+		# Jump from typo to typo with geometric gaps instead of a draw per word
+		log_keep = math.log1p(-self.typo_rate) if self.typo_rate < 1 else -math.inf
+		i = int(math.log(1.0 - rnd.random()) / log_keep)
+		while i < len(words):
+			word = words[i]
+			if len(word) >= 4 and word.isalpha():
+				j = rnd.randrange(1, len(word) - 1)
+				kind = rnd.randrange(3)
+				if kind == 0:
+					# Swapped letters
+					words[i] = word[:j] + word[j + 1] + word[j] + word[j + 2:]
+				elif kind == 1:
+					# Dropped letter
+					words[i] = word[:j] + word[j + 1:]
+				else:
+					# Doubled letter
+					words[i] = word[:j] + word[j] + word[j:]
+			i += 1 + int(math.log(1.0 - rnd.random()) / log_keep)
+		return " ".join(words)
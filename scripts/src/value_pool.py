@@ -0,0 +1,153 @@
+"""Precomputed pools of Faker client values, cached on disk by seed and locale."""
+
+import json
+import os
+import tempfile
+from functools import lru_cache
+import faker
+from faker import Faker
+
+
+POOL_VERSION = 1
+
+DEFAULT_LOCALE = "en_US"
+
+# Client fields drawn from the pool, mapped to the Faker provider producing them
+POOL_FIELDS = {
+	"client_name": "company",
+	"client_address": "address",
+	"client_phone": "phone_number",
+}
+
+
+@lru_cache(maxsize=None)
+def faker_for(locale):
+	"""
+	Return this process's Faker instance for ``locale``, creating it once.
+
+	Loading a locale's providers is far slower than generating values, so
+	every generator and pool in a process shares one instance per locale.
+	Callers seed it (``seed_instance``) before drawing reproducible values.
+
+	Raises:
+		ValueError: If Faker does not know the locale
+	"""
+	try:
+		return Faker(locale)
+	except AttributeError:
+		raise ValueError(f"Unknown Faker locale '{locale}'") from None
+
+
+def parse_locale_mix(text):
+	"""
+	Parse a locale mix given on the command line.
+
+	Accepts ``en_US:70,en_GB:20,de_DE:10``; a locale without a weight gets 1,
+	so ``en_GB,de_DE`` is an even mix.
+
+	Returns:
+		dict: Locale -> weight
+	"""
+	mix = {}
+	for item in text.split(","):
+		locale, _, weight = item.strip().partition(":")
+		if locale:
+			mix[locale] = float(weight) if weight else 1.0
+	return mix
+
+
+class ClientValuePool:
+	"""Client names, addresses and phone numbers generated once and sampled by index."""
+
+	def __init__(self, values, seed=None, locale=DEFAULT_LOCALE):
+		"""
+		Initialize the pool.
+
+		Args:
+			values (dict): Field name -> list of values, one list per POOL_FIELDS
+				entry, all of the same length
+			seed (int, optional): Seed the values were generated from
+			locale (str): Faker locale the values were generated with
+		"""
+		self.values = values
+		self.seed = seed
+		self.locale = locale
+		self.size = len(values["client_name"])
+
+	@classmethod
+	def build(cls, size, seed=None, locale=DEFAULT_LOCALE):
+		"""
+		Generate a pool with the process's Faker instance for ``locale``.
+
+		The instance is seeded from ``seed`` first, so building a pool never
+		moves the global Faker or ``random`` state.
+
+		Args:
+			size (int): Number of values per field
+			seed (int, optional): Seed for the pool's values
+			locale (str): Faker locale
+
+		Returns:
+			ClientValuePool: The new pool
+		"""
+		fake = faker_for(locale)
+		if seed is not None:
+			fake.seed_instance(seed)
+		values = {
+			field: [getattr(fake, provider)() for _ in range(size)]
+			for field, provider in POOL_FIELDS.items()
+		}
+		return cls(values, seed, locale)
+
+	@classmethod
+	def load(cls, size, seed=None, locale=DEFAULT_LOCALE, cache_dir=None):
+		"""
+		Load a pool from the cache directory, building and caching it on a miss.
+
+		Pools are only cached when seeded, since an unseeded pool is different
+		on every run.
+
+		Args:
+			size (int): Number of values per field
+			seed (int, optional): Seed for the pool's values
+			locale (str): Faker locale
+			cache_dir (str, optional): Directory of cached pools
+
+		Returns:
+			ClientValuePool: The pool
+		"""
+		if cache_dir is None or seed is None:
+			return cls.build(size, seed, locale)
+
+		path = os.path.join(cache_dir, f"clients-{locale}-{seed}-{size}.json")
+		try:
+			with open(path) as f:
+				data = json.load(f)
+			if data["version"] == POOL_VERSION and data["faker"] == faker.VERSION:
+				return cls(data["values"], seed, locale)
+		except (OSError, ValueError, KeyError):
+			pass
+
+		pool = cls.build(size, seed, locale)
+		pool.save(path)
+		return pool
+
+	def save(self, path):
+		"""Write the pool to ``path``, replacing it atomically."""
+		data = {
+			"version": POOL_VERSION,
+			# Faker's data and algorithms change between releases
+			"faker": faker.VERSION,
+			"locale": self.locale,
+			"seed": self.seed,
+			"values": self.values,
+		}
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+		fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+		with os.fdopen(fd, "w") as f:
+			json.dump(data, f)
+		os.replace(tmp_path, path)
+
+	def get(self, field, index):
+		"""Return the pooled value of ``field`` at ``index``."""
+		return self.values[field][index]
@@ -0,0 +1,435 @@
+"""Render service document PDFs from HTML with WeasyPrint."""
+
+import copy
+import hashlib
+import html
+import markdown
+from weasyprint import HTML, CSS, __version__ as weasyprint_version
+from weasyprint.text.fonts import FontConfiguration
+from .render_engine import (
+	FINGERPRINT_RECORD,
+	RenderEngine,
+	format_address,
+	format_date,
+	split_parts,
+)
+
+
+# Ways of building the HTML that WeasyPrint renders
+TEMPLATES = ("markdown", "html")
+
+# Precompiled HTML for the fixed document layout. It mirrors what the Markdown
+# path produces, markup for markup, so both engines render the same DOM.
+HTML_BODY_TEMPLATE = """<h1>{company}</h1>
+<h2>SERVICE REPORT</h2>
+<p><strong>Work Order:</strong> {work_order} | <strong>Date:</strong> {date}</p>
+<hr />
+<h2>Client Information</h2>
+<table>
+<thead>
+<tr>
+<th></th>
+<th></th>
+</tr>
+</thead>
+<tbody>
+<tr>
+<td><strong>Client</strong></td>
+<td>{client_name}</td>
+</tr>
+<tr>
+<td><strong>Address</strong></td>
+<td>{client_address}</td>
+</tr>
+<tr>
+<td><strong>Phone</strong></td>
+<td>{client_phone}</td>
+</tr>
+</tbody>
+</table>
+<h2>Equipment Information</h2>
+<table>
+<thead>
+<tr>
+<th>Field</th>
+<th>Value</th>
+</tr>
+</thead>
+<tbody>
+<tr>
+<td>Machine Type</td>
+<td>{machine_type}</td>
+</tr>
+<tr>
+<td>Model</td>
+<td>{machine_model}</td>
+</tr>
+<tr>
+<td>Serial Number</td>
+<td>{serial_number}</td>
+</tr>
+</tbody>
+</table>
+<h2>Service Details</h2>
+<h3>Problem Description</h3>
+<p>{problem_description}</p>
+<h3>Solution Applied</h3>
+<p>{solution_applied}</p>
+<h2>Parts Used</h2>
+<ul>
+{parts_list}
+</ul>
+<h2>Technician Information</h2>
+<table>
+<thead>
+<tr>
+<th></th>
+<th></th>
+</tr>
+</thead>
+<tbody>
+<tr>
+<td><strong>Technician Name</strong></td>
+<td>{technician_name}</td>
+</tr>
+<tr>
+<td><strong>Technician ID</strong></td>
+<td>{technician_id}</td>
+</tr>
+<tr>
+<td><strong>Certification</strong></td>
+<td>{technician_cert}</td>
+</tr>
+<tr>
+<td><strong>Arrival Time</strong></td>
+<td>{arrival_time}</td>
+</tr>
+<tr>
+<td><strong>Labor Hours</strong></td>
+<td>{labor_hours}</td>
+</tr>
+</tbody>
+</table>
+<hr />
+<p><strong>Technician Signature:</strong> _______________________________ <strong>Date:</strong> _______________</p>
+<hr />
+<p><em>{company} | 24/7 Service | (555) 123-4567</em></p>
+<p><em>www.foodservicetech.com | service@foodservicetech.com</em></p>"""
+
+
+def _escape(value):
+	"""Escape a value for HTML text content the same way Markdown does."""
+	return html.escape(str(value), quote=False)
+
+
+# Extra rules for batch rendering: each record starts on a new page
+BATCH_STYLESHEET = """
+section.record + section.record {
+	break-before: page;
+}
+"""
+
+
+class WeasyPrintEngine(RenderEngine):
+	"""Render service documents by laying out HTML with WeasyPrint."""
+
+	def __init__(self, template="markdown"):
+		"""
+		Initialize the WeasyPrint engine.
+
+		Args:
+			template (str): How the HTML is built, one of TEMPLATES. "markdown"
+				converts the Markdown document on every call; "html" fills the
+				precompiled HTML template directly and skips the Markdown parser.
+		"""
+		if template not in TEMPLATES:
+			raise ValueError(f"Unknown template '{template}', expected one of: {', '.join(TEMPLATES)}")
+
+		self.name = template
+		self.template = template
+		self.css = self._get_stylesheet()
+		self.md = markdown.Markdown(extensions=["tables"])
+
+		# The stylesheet never changes, so parse it and set up fonts once and
+		# reuse them for every document rendered by this instance
+		self.font_config = FontConfiguration()
+		self.stylesheet = CSS(string=self.css, font_config=self.font_config)
+		self.batch_stylesheet = CSS(string=BATCH_STYLESHEET, font_config=self.font_config)
+
+	def write_pdf(self, data, target=None):
+		"""
+		Render a service document PDF to a path or a writable sink.
+
+		Args:
+			data (dict): Service record data from ServiceDocumentDataGenerator
+			target (str or file object, optional): Path, or any object with a
+				``write`` method. If None, the PDF is returned instead of written.
+
+		Returns:
+			bytes: The rendered PDF if ``target`` is None, otherwise None
+		"""
+		html_content = self._generate_html(data)
+
+		# Render to PDF
+		return HTML(string=html_content).write_pdf(
+			target, stylesheets=[self.stylesheet], font_config=self.font_config
+		)
+
+	def fingerprint(self):
+		"""
+		Identify this engine's output for caching.
+
+		Hashes the WeasyPrint version, the stylesheet and the HTML built for a
+		fixed record, which is much cheaper than a full render.
+
+		Returns:
+			str: Hex digest that changes whenever the rendered output would
+		"""
+		digest = hashlib.sha256(f"weasyprint {weasyprint_version}\n".encode())
+		digest.update(self.css.encode())
+		digest.update(self._generate_html(FINGERPRINT_RECORD).encode())
+		return digest.hexdigest()
+
+	def render_batch(self, records):
+		"""
+		Render several service documents with a single WeasyPrint layout pass.
+
+		The records are laid out as one HTML document, each starting on a new
+		page, and the result is split back into one PDF per record by page range.
+		This pays the fixed per-call parse and cascade cost once per batch.
+
+		Args:
+			records (list): Service record data dicts
+
+		Returns:
+			list: One PDF (bytes) per record, in the order of ``records``
+		"""
+		sections = "\n".join(
+			f'<section class="record" id="record-{i}">\n{self._generate_body(data)}\n</section>'
+			for i, data in enumerate(records)
+		)
+		document = HTML(string=self._wrap_html(sections, "Service Reports")).render(
+			stylesheets=[self.stylesheet, self.batch_stylesheet],
+			font_config=self.font_config,
+		)
+
+		# Find the page each record starts on. The marker anchors are dropped so
+		# they do not end up as named destinations in the split PDFs.
+		starts = []
+		for page_number, page in enumerate(document.pages):
+			for anchor in [name for name in page.anchors if name.startswith("record-")]:
+				del page.anchors[anchor]
+				starts.append(page_number)
+		starts.append(len(document.pages))
+
+		pdfs = []
+		for data, start, end in zip(records, starts, starts[1:]):
+			record_document = document.copy(document.pages[start:end])
+			record_document.metadata = copy.copy(document.metadata)
+			record_document.metadata.title = f"Service Report - {data['work_order']}"
+			pdfs.append(record_document.write_pdf())
+
+		return pdfs
+
+	def _generate_html(self, data):
+		"""Generate the full HTML document for service data."""
+		return self._wrap_html(self._generate_body(data), f"Service Report - {data['work_order']}")
+
+	def _generate_body(self, data):
+		"""Generate the HTML body for service data with the configured engine."""
+		if self.template == "html":
+			return self._generate_html_body(data)
+
+		# Generate markdown content
+		md_content = self._generate_markdown(data)
+
+		# Convert markdown to HTML
+		html_body = self.md.convert(md_content)
+		self.md.reset()  # Reset for next conversion
+		return html_body
+
+	def _wrap_html(self, html_body, title):
+		"""Wrap an HTML body in a full HTML document."""
+		return f"""
+		<!DOCTYPE html>
+		<html>
+		<head>
+			<meta charset="utf-8">
+			<title>{html.escape(title)}</title>
+		</head>
+		<body>
+			{html_body}
+		</body>
+		</html>
+		"""
+
+	def _generate_html_body(self, data):
+		"""Generate the HTML body from service data using the precompiled template."""
+		parts_list = "\n".join(f"<li>{_escape(part)}</li>" for part in split_parts(data["parts_used"]))
+
+		technician = data["technician"]
+		return HTML_BODY_TEMPLATE.format(
+			company=_escape(data["company"]),
+			work_order=_escape(data["work_order"]),
+			date=_escape(format_date(data["service_date"])),
+			client_name=_escape(data["client_name"]),
+			client_address=_escape(format_address(data["client_address"])),
+			client_phone=_escape(data["client_phone"]),
+			machine_type=_escape(data["machine_type"]),
+			machine_model=_escape(data["machine_model"]),
+			serial_number=_escape(data["serial_number"]),
+			problem_description=_escape(data["problem_description"]),
+			solution_applied=_escape(data["solution_applied"]),
+			parts_list=parts_list,
+			technician_name=_escape(technician["name"]),
+			technician_id=_escape(technician["id"]),
+			technician_cert=_escape(technician["cert"]),
+			arrival_time=_escape(data["arrival_time"]),
+			labor_hours=_escape(data["labor_hours"]),
+		)
+
+	def _generate_markdown(self, data):
+		"""Generate markdown content from service data."""
+		date_str = format_date(data["service_date"])
+		address = format_address(data["client_address"])
+		parts_list = "\n".join(f"- {part}" for part in split_parts(data["parts_used"]))
+
+		# Build markdown document
+		md_content = f"""# {data['company']}
+
+## SERVICE REPORT
+
+**Work Order:** {data['work_order']} | **Date:** {date_str}
+
+---
+
+## Client Information
+
+| | |
+|---|---|
+| **Client** | {data['client_name']} |
+| **Address** | {address} |
+| **Phone** | {data['client_phone']} |
+
+## Equipment Information
+
+| Field | Value |
+|-------|-------|
+| Machine Type | {data['machine_type']} |
+| Model | {data['machine_model']} |
+| Serial Number | {data['serial_number']} |
+
+## Service Details
+
+### Problem Description
+
+{data['problem_description']}
+
+### Solution Applied
+
+{data['solution_applied']}
+
+## Parts Used
+
+{parts_list}
+
+## Technician Information
+
+| | |
+|---|---|
+| **Technician Name** | {data['technician']['name']} |
+| **Technician ID** | {data['technician']['id']} |
+| **Certification** | {data['technician']['cert']} |
+| **Arrival Time** | {data['arrival_time']} |
+| **Labor Hours** | {data['labor_hours']} |
+
+---
+
+**Technician Signature:** _______________________________ **Date:** _______________
+
+---
+
+*{data['company']} | 24/7 Service | (555) 123-4567*
+
+*www.foodservicetech.com | service@foodservicetech.com*
+"""
+		return md_content
+
+	def _get_stylesheet(self):
+		"""Return CSS stylesheet for PDF rendering."""
+		return """
+		@page {
+			size: letter;
+			margin: 0.75in;
+		}
+
+		body {
+			font-family: Helvetica, Arial, sans-serif;
+			font-size: 10pt;
+			line-height: 1.4;
+			color: #333;
+		}
+
+		h1 {
+			font-size: 18pt;
+			margin-bottom: 0.25em;
+			color: #222;
+		}
+
+		h2 {
+			font-size: 14pt;
+			margin-top: 1.25em;
+			margin-bottom: 0.5em;
+			padding-bottom: 0.25em;
+			border-bottom: 1px solid #ccc;
+		}
+
+		h3 {
+			font-size: 11pt;
+			margin-top: 1em;
+			margin-bottom: 0.25em;
+		}
+
+		p {
+			margin: 0.5em 0;
+		}
+
+		table {
+			width: 100%;
+			border-collapse: collapse;
+			margin: 0.5em 0;
+		}
+
+		th, td {
+			border: 1px solid #ddd;
+			padding: 0.4em 0.6em;
+			text-align: left;
+			vertical-align: top;
+		}
+
+		th {
+			background-color: #f5f5f5;
+			font-weight: bold;
+		}
+
+		hr {
+			border: none;
+			border-top: 1px solid #ccc;
+			margin: 1em 0;
+		}
+
+		ul {
+			margin: 0.5em 0;
+			padding-left: 1.5em;
+		}
+
+		li {
+			margin: 0.25em 0;
+		}
+
+		em {
+			font-style: italic;
+			color: #666;
+			font-size: 9pt;
+		}
+		"""
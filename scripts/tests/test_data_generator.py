@@ -0,0 +1,23 @@
+"""Tests for the service record generator."""
+
+import numpy as np
+import pytest
+from src.data_generator import ServiceDocumentDataGenerator
+
+
+def test_million_record_batch():
+	# The README's compact records example
+	data_gen = ServiceDocumentDataGenerator(
+		seed=42, vectorized=True, pool_size=10_000, work_order_digits=7
+	)
+	batch = data_gen.batch_at(0, 1_000_000)
+	assert len(batch) == 1_000_000
+	assert len(np.unique(batch.columns["work_order"])) == 1_000_000
+	assert batch[1234]["client_name"]
+
+
+def test_default_work_orders_end_at_900000():
+	data_gen = ServiceDocumentDataGenerator(seed=42, vectorized=True)
+	assert len(data_gen.batch_at(899_990, 900_000)) == 10
+	with pytest.raises(ValueError, match="work_order_digits"):
+		data_gen.batch_at(0, 1_000_000)
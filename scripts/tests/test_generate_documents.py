@@ -0,0 +1,32 @@
+"""Tests for the generate_documents command line."""
+
+from click.testing import CliRunner
+from generate_documents import generate
+
+
+def run(tmp_path, *args):
+	"""Run the command with the ReportLab engine into ``tmp_path``."""
+	return CliRunner().invoke(generate, ["-o", str(tmp_path), "-e", "reportlab", *args])
+
+
+def test_issue_skew_by_name_is_a_skew_error(tmp_path):
+	result = run(tmp_path, "-n", "2", "--skew", "issue=Fryers:5")
+	assert result.exit_code == 2
+	assert "Invalid value for --skew" in result.output
+	assert "issue= takes zipf:S" in result.output
+
+
+def test_issue_skew_zipf(tmp_path):
+	result = run(tmp_path, "-n", "2", "--skew", "issue=zipf:1.1")
+	assert result.exit_code == 0, result.output
+	assert len(list(tmp_path.glob("*.pdf"))) == 2
+
+
+def test_incremental_counts_regenerated_documents(tmp_path):
+	args = ("-n", "5", "-s", "3", "--as-of", "2025-01-01", "-w", "1")
+	assert run(tmp_path, *args).exit_code == 0
+	(tmp_path / "service_doc_0002.pdf").unlink()
+	result = run(tmp_path, *args, "-i", "-v")
+	assert result.exit_code == 0, result.output
+	assert "Generated: service_doc_0002.pdf" in result.output
+	assert "Re-rendered 1, kept 4 unchanged" in result.output
@@ -0,0 +1,15 @@
+"""Tests for the offline issue text variations."""
+
+from src.records import catalog_tables
+from src.text_variation import IssueVariator
+
+
+def test_no_contracted_modal_have():
+	variator = IssueVariator(seed=7, typo_rate=0)
+	problems = [
+		problem
+		for category in catalog_tables()["categories"]
+		for _, problem, _ in variator.iter_texts(category, 2000)
+	]
+	assert any("we have to" in problem.lower() for problem in problems)
+	assert not any("we've to" in problem.lower() for problem in problems)
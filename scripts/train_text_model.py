@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Train the offline problem-text model on generated_data."""
+
+import os
+import random
+import click
+from src.text_model import MarkovTextModel
+
+
+@click.command()
+@click.option(
+	"--data",
+	"-d",
+	default="generated_data",
+	type=click.Path(exists=True, file_okay=False),
+	help="Directory of generate_service_data.py JSON output",
+)
+@click.option(
+	"--output",
+	"-o",
+	default=os.path.join("generated_data", "text_model.npz"),
+	help="Model file to write",
+)
+@click.option(
+	"--order",
+	default=2,
+	type=click.IntRange(min=1),
+	help="Words of context; higher is more fluent but closer to the training texts",
+)
+@click.option("--samples", default=3, help="Number of sample texts to print per category")
+def main(data, output, order, samples):
+	"""Train the offline problem-text model on generated_data."""
+	try:
+		model = MarkovTextModel.train(data, order=order)
+	except ValueError as e:
+		raise click.ClickException(str(e))
+	model.save(output)
+
+	click.echo(f"Vocabulary: {len(model.vocab)} words")
+	for category, chain in model.chains.items():
+		click.echo(f"{category}: {len(chain.seen)} texts, {len(chain.words)} transitions")
+	click.echo(f"Saved model to {output} ({os.path.getsize(output) / 1024:.1f} KB)")
+
+	rnd = random.Random(0)
+	for category in model.chains:
+		click.echo(f"\n{category}:")
+		for _ in range(samples):
+			click.echo(f"  - {model.generate(category, rnd)}")
+
+
+if __name__ == "__main__":
+	main()